@@ -11,7 +11,7 @@ a = Analysis(
         ('camera.png', '.'),
         ('rust_controller.png', '.'),
     ],
-    hiddenimports=[],
+    hiddenimports=['orjson'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
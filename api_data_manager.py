@@ -38,6 +38,9 @@ class APIDataManager:
         self.ITEMS_LIMIT = 10000
         self.ITEMS_OFFSET = 0
         
+        # Shared HTTP session so calls to the Rust API reuse the TLS connection
+        self.session = requests.Session()
+        
         # Cache for database
         self.item_database_cache = None
         self.last_cache_time = 0
@@ -80,7 +83,7 @@ class APIDataManager:
             url = f"{self.ITEMS_ENDPOINT}?limit={self.ITEMS_LIMIT}&offset={self.ITEMS_OFFSET}"
             logger.info(f"Fetching items from Rust API: {url}")
             
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -115,7 +118,7 @@ class APIDataManager:
             logger.info("Downloading images from Rust API...")
             
             # Download the zip file
-            response = requests.get(self.IMAGES_ENDPOINT, stream=True, timeout=60)
+            response = self.session.get(self.IMAGES_ENDPOINT, stream=True, timeout=60)
             response.raise_for_status()
             
             # Save the zip file temporarily
@@ -159,6 +162,11 @@ class APIDataManager:
             items = {}
             item_count = 0
             
+            # Index itemids by shortname once instead of scanning api_items per ingredient
+            itemid_by_shortname = {}
+            for search_item in api_items:
+                itemid_by_shortname.setdefault(search_item.get("shortname"), search_item.get("itemid"))
+            
             for api_item in api_items:
                 try:
                     # Extract item data from API response
@@ -181,11 +189,7 @@ class APIDataManager:
                         ingredient_amount = ingredient.get("amount", 0)
                         
                         # Find the ingredient's itemid in our database
-                        ingredient_itemid = None
-                        for search_item in api_items:
-                            if search_item.get("shortname") == ingredient_shortname:
-                                ingredient_itemid = search_item.get("itemid")
-                                break
+                        ingredient_itemid = itemid_by_shortname.get(ingredient_shortname)
                         
                         if ingredient_itemid is not None:
                             ingredients.append({
@@ -281,11 +285,21 @@ class APIDataManager:
             self.item_database_cache = None
             self.crafting_data_cache = None
             
+            # Stats for the freshly written database, so callers don't have to reload it
+            recipe_count = self._count_recipes(items)
+            
             return {
                 "success": True,
                 "message": f"Database updated with {len(items)} items from API",
                 "itemCount": len(items),
-                "imageCount": images_result.get("image_count", 0) if images_result.get("success") else 0
+                "imageCount": images_result.get("image_count", 0) if images_result.get("success") else 0,
+                "stats": {
+                    "itemCount": len(items),
+                    "recipeCount": recipe_count,
+                    "craftableItems": recipe_count,
+                    "lastUpdated": database["metadata"]["lastUpdated"],
+                    "source": database["metadata"]["source"]
+                }
             }
             
         except Exception as e:
@@ -471,26 +485,27 @@ class APIDataManager:
             logger.error(f"Failed to get all crafting recipes: {e}")
             return {"recipes": []}
     
+    def _count_recipes(self, items: Dict[str, Any]) -> int:
+        """Count items that have a crafting recipe"""
+        return sum(
+            1 for item_data in items.values()
+            if item_data.get("ingredients") and item_data.get("userCraftable")
+        )
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         database = self.load_database()
         
-        # Count items with crafting data
-        items = database.get("items", {})
-        recipe_count = 0
-        craftable_items = 0
-        
-        for item_data in items.values():
-            if item_data.get("ingredients") and item_data.get("userCraftable"):
-                recipe_count += 1
-                craftable_items += 1
+        # Count items with crafting data (every recipe is a craftable item)
+        recipe_count = self._count_recipes(database.get("items", {}))
+        metadata = database.get("metadata", {})
         
         return {
-            "itemCount": database.get("metadata", {}).get("itemCount", 0),
+            "itemCount": metadata.get("itemCount", 0),
             "recipeCount": recipe_count,
-            "craftableItems": craftable_items,
-            "lastUpdated": database.get("metadata", {}).get("lastUpdated"),
-            "source": database.get("metadata", {}).get("source", "API")
+            "craftableItems": recipe_count,
+            "lastUpdated": metadata.get("lastUpdated"),
+            "source": metadata.get("source", "API")
         }
     
     def reset_item_database(self) -> Dict[str, Any]:
@@ -559,11 +574,11 @@ class APIDataManager:
             
             # Test items endpoint with limit parameters
             items_url = f"{self.ITEMS_ENDPOINT}?limit={self.ITEMS_LIMIT}&offset={self.ITEMS_OFFSET}"
-            items_response = requests.get(items_url, timeout=10)
+            items_response = self.session.get(items_url, timeout=10)
             items_status = items_response.status_code == 200
             
             # Test images endpoint
-            images_response = requests.head(self.IMAGES_ENDPOINT, timeout=10)
+            images_response = self.session.head(self.IMAGES_ENDPOINT, timeout=10)
             images_status = images_response.status_code == 200
             
             return {
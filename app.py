@@ -14,6 +14,15 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+# Places the Rust client's items.preload.bundle can live, in search order
+_RUST_CLIENT_PATH = Path("data/steamcmd/steamapps/common/Rust")
+ITEMS_BUNDLE_PATHS = (
+    _RUST_CLIENT_PATH / "Bundles" / "shared" / "items.preload.bundle",
+    _RUST_CLIENT_PATH / "RustClient_Data" / "Bundles" / "shared" / "items.preload.bundle",
+    Path("data/rustclient/Bundles/shared/items.preload.bundle"),
+    Path("data/rustclient/data/rustclient/Bundles/shared/items.preload.bundle"),
+)
+
 class RustGameController:
     """Controller class for Rust game actions"""
     
@@ -2597,11 +2606,14 @@ def get_craftable_items():
             if full_item:
                 craftable_items[item_id] = full_item
         
-        return jsonify({
+        response = jsonify({
             "success": True,
             "items": craftable_items,
             "count": len(craftable_items)
         })
+        # Let the GUI's If-None-Match refreshes get a bodyless 304 when nothing changed
+        response.add_etag()
+        return response.make_conditional(request)
     except Exception as e:
         logger.error(f"Error in get_craftable_items: {e}")
         return jsonify({"error": str(e)}), 500
@@ -2701,16 +2713,8 @@ def update_crafting_data():
     """Update crafting data from Unity bundles and merge into item database"""
     try:
         # Find the items.preload.bundle file
-        steam_apps_path = Path("data/steamcmd/steamapps/common/Rust")
-        possible_bundle_paths = [
-            steam_apps_path / "Bundles" / "shared" / "items.preload.bundle",
-            steam_apps_path / "RustClient_Data" / "Bundles" / "shared" / "items.preload.bundle",
-            Path("data/rustclient/Bundles/shared/items.preload.bundle"),
-            Path("data/rustclient/data/rustclient/Bundles/shared/items.preload.bundle"),
-        ]
-        
         bundle_path = None
-        for path in possible_bundle_paths:
+        for path in ITEMS_BUNDLE_PATHS:
             if path.exists():
                 bundle_path = path
                 logger.info(f"Found items bundle at: {bundle_path}")
@@ -1,10 +1,15 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import logging.handlers
 import sys
 import os
+import json
+import functools
+import signal
 import time
 from datetime import datetime
 import webbrowser
@@ -14,28 +19,298 @@ import pystray
 from pystray import MenuItem as item
 import winreg
 from api_data_manager import api_data_manager
-import atexit
+import traceback
 import pyperclip
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging to capture all messages
-class QueueHandler(logging.Handler):
+# Local API server
+BASE_URL = "http://localhost:5000"
+HEALTH_URL = BASE_URL + "/health"
+STATS_URL = BASE_URL + "/steam/stats"
+CRAFTABLE_ITEMS_URL = BASE_URL + "/steam/craftable-items"
+TEST_INSTALLATION_URL = BASE_URL + "/steam/test-installation"
+ANTI_AFK_STATUS_URL = BASE_URL + "/anti-afk/status"
+REGENERATE_BINDS_URL = BASE_URL + "/binds-manager/regenerate-cleared"
+CLEAR_KEYBOARD_CACHE_URL = BASE_URL + "/keyboard-manager/clear-cache"
+# Connecting to loopback is near-instant; only the read side needs the long timeouts
+CONNECT_TIMEOUT = 0.2
+
+# Map action names to API endpoints
+ENDPOINT_MAP = {
+    "craft": "/craft/name",
+    "cancel_craft": "/craft/cancel/name",
+    "cancel_all_crafting": "/craft/cancel-all",
+    "suicide": "/player/suicide",
+    "kill": "/player/kill",
+    "respawn": "/player/respawn",
+    "respawn_only": "/player/respawn-only",
+    "respawn_random": "/player/respawn-random",
+    "respawn_bed": "/player/respawn-bed",
+    "gesture": "/player/gesture",
+    "auto_run": "/player/auto-run",
+    "auto_run_jump": "/player/auto-run-jump",
+    "auto_crouch_attack": "/player/auto-crouch-attack",
+    "global_chat": "/chat/global",
+    "team_chat": "/chat/team",
+    "quit_game": "/game/quit",
+    "disconnect": "/game/disconnect",
+    "connect": "/game/connect",
+    "stack_inventory": "/inventory/stack",
+    "inventory_give": "/inventory/give",
+    "set_look_radius": "/settings/look-radius",
+    "set_voice_volume": "/settings/voice-volume",
+    "set_master_volume": "/settings/master-volume",
+    "set_hud_state": "/settings/hud",
+    "copy_json": "/clipboard/copy-json",
+    "type_string": "/input/type-enter",
+    "start_anti_afk": "/anti-afk/start",
+    "stop_anti_afk": "/anti-afk/stop",
+    "toggle_stack_inventory": "/inventory/toggle-stack",
+    "noclip_toggle": "/player/noclip",
+    "god_mode_toggle": "/player/god-mode",
+    "set_time": "/player/set-time",
+    "teleport_to_marker": "/player/teleport-marker",
+    "toggle_combat_log": "/player/combat-log",
+    "clear_console": "/player/clear-console",
+    "toggle_console": "/player/toggle-console",
+    "ent_kill": "/player/ent-kill"
+}
+URL_MAP = {action: BASE_URL + endpoint for action, endpoint in ENDPOINT_MAP.items()}
+
+# Actions that can take up to 2 minutes server-side
+LONG_RUNNING_ACTIONS = frozenset({"stack_inventory", "cancel_all_crafting", "toggle_stack_inventory", "inventory_give"})
+
+# Starting content of the inventory give JSON box
+DEFAULT_GIVE_JSON = '[{"item_name": "wood", "quantity": 1000}]'
+
+def validate_inventory_items(items):
+    """Check an inventory give payload; return a list of problems (empty when valid)"""
+    if not isinstance(items, list):
+        return ["JSON must be an array of objects"]
+    if not items:
+        return ["JSON array cannot be empty"]
+    
+    errors = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append(f"Item {i} must be an object")
+            continue
+        
+        if 'item_name' not in item:
+            errors.append(f"Item {i} missing required field 'item_name'")
+        elif not isinstance(item['item_name'], str):
+            errors.append(f"Item {i} item_name must be a string")
+        
+        if 'quantity' in item:
+            quantity = item['quantity']
+            if not isinstance(quantity, (int, float)):
+                errors.append(f"Item {i} quantity must be a number")
+            elif quantity <= 0:
+                errors.append(f"Item {i} quantity must be greater than 0")
+    return errors
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# PowerShell equivalents of an API call, for the Copy PowerShell buttons
+PS_TEMPLATE_NOBODY = 'Invoke-WebRequest -Uri "{url}" -Method POST -Headers @{{"Content-Type"="application/json"}}'
+# The URL is fixed per action, so only the body is joined on at click time
+PS_COMMAND_MAP = {action: PS_TEMPLATE_NOBODY.format(url=url) for action, url in URL_MAP.items()}
+
+# Handle both development and packaged executable paths
+if getattr(sys, 'frozen', False):
+    # Running as executable
+    ICON_BASE_PATH = sys._MEIPASS if hasattr(sys, '_MEIPASS') else os.path.dirname(sys.executable)
+else:
+    # Running as script
+    ICON_BASE_PATH = os.path.dirname(__file__)
+
+# Processed 64x64 tray icon pixels, keyed by source path and mtime
+TRAY_ICON_SIZE = (64, 64)
+TRAY_ICON_CACHE = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'),
+                               'RustGameController', 'tray64.raw')
+
+def _load_tray_icon(icon_path, keep_modes):
+    """Load icon_path as a 64x64 tray image, reusing the processed pixels cached on disk"""
+    key = f"{os.path.abspath(icon_path)}|{os.path.getmtime(icon_path)}".encode('utf-8')
+    try:
+        with open(TRAY_ICON_CACHE, 'rb') as f:
+            header, data = f.read().split(b'\n', 1)
+        cached_key, mode = header.rsplit(b'|', 1)
+        if cached_key == key:
+            return Image.frombytes(mode.decode('ascii'), TRAY_ICON_SIZE, data)
+    except (OSError, ValueError):
+        pass
+    
+    image = Image.open(icon_path)
+    # Preserve transparency where the format carries it, otherwise use RGB
+    if image.mode not in keep_modes and image.mode != 'RGB':
+        image = image.convert('RGB')
+    # Resize to appropriate size for system tray
+    image = image.resize(TRAY_ICON_SIZE, Image.Resampling.LANCZOS)
+    if image.mode in ('LA', 'P'):
+        # Same conversion optimize_icon_for_system_tray would apply, done before caching
+        image = image.convert('RGBA')
+    
+    try:
+        os.makedirs(os.path.dirname(TRAY_ICON_CACHE), exist_ok=True)
+        with open(TRAY_ICON_CACHE, 'wb') as f:
+            f.write(key + b'|' + image.mode.encode('ascii') + b'\n' + image.tobytes())
+    except OSError:
+        pass
+    return image
+
+@functools.lru_cache(maxsize=None)
+def _existing_icon_paths(icon_names):
+    """Return (name, path) for each candidate icon file that exists, in order; cached per tuple"""
+    return tuple((name, os.path.join(ICON_BASE_PATH, name)) for name in icon_names
+                 if os.path.exists(os.path.join(ICON_BASE_PATH, name)))
+
+class UpdateCancelled(Exception):
+    """Raised from a worker's progress callback to abandon it during shutdown"""
+
+# Formats records for the log panel; runs on the QueueListener thread.
+# It never touches Tk: quit_app joins this thread from the Tk thread, so a Tcl call
+# here could leave each thread waiting on the other. The Tk side drains log_queue.
+class GUILogHandler(logging.Handler):
     def __init__(self, log_queue):
         super().__init__()
         self.log_queue = log_queue
 
     def emit(self, record):
-        self.log_queue.put(self.format(record))
+        # QueueListener doesn't guard handle(), so an error here would end logging for the session
+        try:
+            self.log_queue.put(self.format(record))
+        except Exception:
+            self.handleError(record)
 
 class RustControllerGUI:
+    # Combobox value lists shared by the settings rows
+    VOLUME_VALUES = ("0", "0.25", "0.5", "0.75", "1")
+    HUD_VALUES = ("enabled", "disabled")
+    RADIUS_VALUES = ("20", "0.0002")
+    TIME_VALUES = ("0", "4", "8", "12", "16", "20", "24")
+    
+    # Gestures offered in the emote dropdown
+    EMOTES = (
+        "wave", "victory", "shrug", "thumbsup", "hurry", "ok", "thumbsdown", 
+        "clap", "point", "friendly", "cabbagepatch", "twist", "raisetheroof", 
+        "beatchest", "throatcut", "fingergun", "shush", "shush_vocal", 
+        "watchingyou", "loser", "nono", "knucklescrack", "rps"
+    )
+    
+    # Parameterless action rows for the API testing panel: each row is a tuple of (button text, action)
+    RESPAWN_ROWS = (
+        (("Suicide (just kill)", "kill"),),
+        (("Random spawn (just respawn)", "respawn_only"),),
+        (("Respawn random (kill and respawn)", "respawn_random"),),
+    )
+    MOVEMENT_ACTIONS = (("Auto Run", "auto_run"), ("Auto Run & Jump", "auto_run_jump"),
+                        ("Auto Crouch & Attack", "auto_crouch_attack"))
+    ADMIN_ACTION_ROWS = (
+        (("Teleport to Marker", "teleport_to_marker"), ("Toggle Combat Log", "toggle_combat_log"),
+         ("Ent Kill", "ent_kill")),
+        (("Clear Console", "clear_console"), ("Toggle Console", "toggle_console")),
+    )
+    GAME_ACTIONS = (("Quit Game", "quit_game"), ("Disconnect", "disconnect"))
+    
+    # Background check intervals (seconds)
+    STATS_INTERVAL = 30
+    SERVER_CHECK_INTERVAL = 30
+    # How long a successful health check is trusted (seconds)
+    HEALTH_CACHE_TTL = 2.0
+    # Window in which repeated dropdown refresh requests collapse into one fetch (ms)
+    REFRESH_DEBOUNCE_MS = 300
+    # Log panel poll interval while lines are arriving, so bursts share one insert (ms)
+    LOG_BATCH_MS = 100
+    # Longest the poll backs off to while the log queue stays empty (ms)
+    LOG_IDLE_MS = 1000
+    # Lines copied out of the log widget per write when saving
+    SAVE_CHUNK_LINES = 256
+    
+    # Settings panel rows: (label, variable attribute, default, combobox values, action, param key, cast)
+    SETTINGS_ROWS = (
+        ("Look at Radius:", "radius_var", "20", RADIUS_VALUES,
+         "set_look_radius", "radius", float),
+        ("Voice Volume:", "voice_volume_var", "0.5", VOLUME_VALUES,
+         "set_voice_volume", "volume", float),
+        ("Master Volume:", "master_volume_var", "0.5", VOLUME_VALUES,
+         "set_master_volume", "volume", float),
+        ("HUD State:", "hud_state_var", "enabled", HUD_VALUES,
+         "set_hud_state", "enabled", "enabled".__eq__),
+    )
+    
     def __init__(self):
         # Variables
+        # Current log panel poll interval; doubles while the queue is empty
+        self._log_poll_ms = self.LOG_BATCH_MS
+        # The Tk root is created last; background threads check for None until then
+        self.root = None
+        # Widgets that status updates touch; None until _build_gui creates them
+        self.server_menu = None
+        self.launch_menu = None
+        self.db_stats_var = None
         self.server_running = False
-        self.log_queue = queue.Queue()
+        self.log_queue = queue.SimpleQueue()
+        # Registry flags are read once here; the menu toggles keep them in sync
         self.startup_enabled = self.check_startup_enabled()
         self.start_minimized_enabled = self.check_start_minimized_enabled()
+        # Startup command last written to the Run key this session
+        self._last_startup_cmd = None
+        # Command line that relaunches this app; it can't change while the process runs
+        app_path = sys.argv[0]
+        if app_path.endswith('.py'):
+            # If running as script, use python executable
+            self._startup_cmd = f'"{sys.executable}" "{app_path}"'
+        else:
+            # If running as exe
+            self._startup_cmd = f'"{app_path}"'
         self.shutdown_event = threading.Event()
         
+        # Pooled keep-alive session for calls to the local API server
+        self.http = requests.Session()
+        # No silent retries: a refused loopback connection should fail straight away
+        self.http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                               max_retries=Retry(total=0, connect=0, read=0)))
+        
+        # Long-lived worker for database/binds jobs instead of a new thread per click.
+        # Pool threads are non-daemon, so every exit path ends in os._exit (quit_app, main)
+        # rather than waiting on a download that may be stalled
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="worker")
+        # Small pool for API test calls; long-running actions must not block quick ones
+        self._api_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api")
+        # (action, serialized params) of API test calls that have not finished yet
+        self._inflight_calls = set()
+        
+        # Progress updates from the worker, drained by a ~30 FPS poll on the Tk thread
+        self._progress_queue = queue.SimpleQueue()
+        self._update_future = None
+        # Last values written to the progress widgets, to skip redundant Tcl updates
+        self._last_progress_int = None
+        self._last_progress_msg = None
+        # (raw lastUpdated, formatted date) from the last stats fetch
+        self._date_cache = (None, None)
+        # (monotonic time, healthy) of the last /health probe
+        self._last_health = (0.0, False)
+        # (JSON text, items) from the last successful inventory validation
+        self._inventory_cache = (None, None)
+        # Craftable item names in the dropdowns and the ETag of the response they came from
+        self._item_names = ()
+        self._items_etag = None
+        # True while a debounced dropdown refresh is waiting to run
+        self._refresh_pending = False
+        # Server status last shown in the menu, to skip repeated updates
+        self._server_status = None
+        # Latest stats text waiting for the main thread; None when nothing is scheduled
+        self._pending_stats = None
+        self._pending_stats_lock = threading.Lock()
+        
+        # Route Ctrl+C / termination requests through the normal quit path
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        
         # Setup logging
         self.setup_logging()
         
@@ -48,44 +323,31 @@ class RustControllerGUI:
         # Start background tasks before GUI
         self.start_background_tasks()
     
-        # Run GUI in main thread (simpler and more reliable)
-        self._run_gui()
+        # Build GUI in main thread; run() enters the Tk main loop
+        self._build_gui()
     
     def setup_window_icon(self):
         """Set the window icon using PhotoImage (keyfree-companion method)"""
         try:
-            import os
-            import sys
-            
-            # Handle both development and packaged executable paths
-            if getattr(sys, 'frozen', False):
-                # Running as executable
-                base_path = sys._MEIPASS if hasattr(sys, '_MEIPASS') else os.path.dirname(sys.executable)
-            else:
-                # Running as script
-                base_path = os.path.dirname(__file__)
-            
             # Try camera.png first (PNG files work better with iconphoto)
-            for icon_name in ['camera.png', 'rust_controller.png', 'camera.ico', 'rust_controller.ico']:
-                icon_path = os.path.join(base_path, icon_name)
-                if os.path.exists(icon_path):
-                    try:
-                        if icon_name.endswith('.png'):
-                            # Load and set the icon using PhotoImage (keyfree-companion approach)
-                            icon_image = tk.PhotoImage(file=icon_path)
-                            self.root.iconphoto(True, icon_image)
-                            # Keep a reference to prevent garbage collection
-                            self.window_icon = icon_image
-                            self.log_message(f"✅ Set window icon using PhotoImage: {icon_name}")
-                            return
-                        else:
-                            # Fallback to iconbitmap for ICO files
-                            self.root.iconbitmap(icon_path)
-                            self.log_message(f"✅ Set window icon using iconbitmap: {icon_name}")
-                            return
-                    except Exception as e:
-                        self.log_message(f"⚠️ Failed to load {icon_name}: {e}")
-                        continue
+            for icon_name, icon_path in _existing_icon_paths(('camera.png', 'rust_controller.png', 'camera.ico', 'rust_controller.ico')):
+                try:
+                    if icon_name.endswith('.png'):
+                        # Load and set the icon using PhotoImage (keyfree-companion approach)
+                        icon_image = tk.PhotoImage(file=icon_path)
+                        self.root.iconphoto(True, icon_image)
+                        # Keep a reference to prevent garbage collection
+                        self.window_icon = icon_image
+                        self.log_message(f"✅ Set window icon using PhotoImage: {icon_name}")
+                        return
+                    else:
+                        # Fallback to iconbitmap for ICO files
+                        self.root.iconbitmap(icon_path)
+                        self.log_message(f"✅ Set window icon using iconbitmap: {icon_name}")
+                        return
+                except Exception as e:
+                    self.log_message(f"⚠️ Failed to load {icon_name}: {e}")
+                    continue
             
             self.log_message("⚠️ No suitable icon files found")
         except Exception as e:
@@ -94,29 +356,16 @@ class RustControllerGUI:
     def setup_taskbar_icon(self):
         """Set the taskbar icon for Windows (additional method for better compatibility)"""
         try:
-            import os
-            import sys
-            
-            # Handle both development and packaged executable paths
-            if getattr(sys, 'frozen', False):
-                # Running as executable
-                base_path = sys._MEIPASS if hasattr(sys, '_MEIPASS') else os.path.dirname(sys.executable)
-            else:
-                # Running as script
-                base_path = os.path.dirname(__file__)
-            
             # Try to set taskbar icon using ICO file (best for Windows)
-            for icon_name in ['rust_controller.ico', 'camera.ico']:
-                icon_path = os.path.join(base_path, icon_name)
-                if os.path.exists(icon_path):
-                    try:
-                        # Set the window icon again specifically for taskbar
-                        self.root.iconbitmap(icon_path)
-                        self.log_message(f"✅ Set taskbar icon: {icon_name}")
-                        return
-                    except Exception as e:
-                        self.log_message(f"⚠️ Failed to set taskbar icon {icon_name}: {e}")
-                        continue
+            for icon_name, icon_path in _existing_icon_paths(('rust_controller.ico', 'camera.ico')):
+                try:
+                    # Set the window icon again specifically for taskbar
+                    self.root.iconbitmap(icon_path)
+                    self.log_message(f"✅ Set taskbar icon: {icon_name}")
+                    return
+                except Exception as e:
+                    self.log_message(f"⚠️ Failed to set taskbar icon {icon_name}: {e}")
+                    continue
             
             self.log_message("⚠️ No suitable ICO file found for taskbar icon")
         except Exception as e:
@@ -125,29 +374,16 @@ class RustControllerGUI:
     def setup_menu_bar_icon(self):
         """Set the menu bar icon for Windows (additional method for better compatibility)"""
         try:
-            import os
-            import sys
-            
-            # Handle both development and packaged executable paths
-            if getattr(sys, 'frozen', False):
-                # Running as executable
-                base_path = sys._MEIPASS if hasattr(sys, '_MEIPASS') else os.path.dirname(sys.executable)
-            else:
-                # Running as script
-                base_path = os.path.dirname(__file__)
-            
             # Try to set menu bar icon using ICO file (best for Windows)
-            for icon_name in ['rust_controller.ico', 'camera.ico']:
-                icon_path = os.path.join(base_path, icon_name)
-                if os.path.exists(icon_path):
-                    try:
-                        # Set the window icon again specifically for menu bar
-                        self.root.iconbitmap(icon_path)
-                        self.log_message(f"✅ Set menu bar icon: {icon_name}")
-                        return
-                    except Exception as e:
-                        self.log_message(f"⚠️ Failed to set menu bar icon {icon_name}: {e}")
-                        continue
+            for icon_name, icon_path in _existing_icon_paths(('rust_controller.ico', 'camera.ico')):
+                try:
+                    # Set the window icon again specifically for menu bar
+                    self.root.iconbitmap(icon_path)
+                    self.log_message(f"✅ Set menu bar icon: {icon_name}")
+                    return
+                except Exception as e:
+                    self.log_message(f"⚠️ Failed to set menu bar icon {icon_name}: {e}")
+                    continue
             
             self.log_message("⚠️ No suitable ICO file found for menu bar icon")
         except Exception as e:
@@ -190,27 +426,37 @@ class RustControllerGUI:
         except Exception as e:
             self.log_message(f"⚠️ Error optimizing icon for system tray: {e}")
     
+    def _format_database_stats(self, stats):
+        """Format a database stats dict for the Information panel"""
+        item_count = stats.get('itemCount', 0)
+        last_updated = stats.get('lastUpdated', '')
+        if last_updated:
+            # Format the date nicely; lastUpdated rarely changes between polls
+            cached_raw, date_str = self._date_cache
+            if last_updated != cached_raw:
+                try:
+                    if last_updated.endswith('Z'):
+                        dt = datetime.fromisoformat(last_updated[:-1] + '+00:00')
+                    else:
+                        dt = datetime.fromisoformat(last_updated)
+                    date_str = dt.strftime('%Y-%m-%d %H:%M')
+                except ValueError:
+                    date_str = None
+                self._date_cache = (last_updated, date_str)
+            if date_str:
+                return f"Database: {item_count} items (Updated: {date_str})"
+            return f"Database: {item_count} items"
+        else:
+            return f"Database: {item_count} items"
+    
     def _fetch_database_stats(self):
         """Fetch database statistics (called from background thread)"""
         try:
-            response = requests.get("http://localhost:5000/steam/stats", timeout=2)
+            response = self.http.get(STATS_URL, timeout=(CONNECT_TIMEOUT, 2))
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success'):
-                    stats = data.get('stats', {})
-                    item_count = stats.get('itemCount', 0)
-                    last_updated = stats.get('lastUpdated', '')
-                    if last_updated:
-                        # Format the date nicely
-                        try:
-                            from datetime import datetime
-                            dt = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
-                            date_str = dt.strftime('%Y-%m-%d %H:%M')
-                            return f"Database: {item_count} items (Updated: {date_str})"
-                        except:
-                            return f"Database: {item_count} items"
-                    else:
-                        return f"Database: {item_count} items"
+                    return self._format_database_stats(data.get('stats', {}))
                 else:
                     return "Database: No data available"
             else:
@@ -225,26 +471,27 @@ class RustControllerGUI:
         if not self.server_running:
             return False
         
+        # Reuse a recent result so rapid button presses don't each ping /health
+        now = time.monotonic()
+        checked_at, healthy = self._last_health
+        if healthy and now - checked_at < self.HEALTH_CACHE_TTL:
+            return True
+        
         try:
             # Check if server is responding
-            response = requests.get("http://localhost:5000/health", timeout=2)
+            response = self.http.get(HEALTH_URL, timeout=(CONNECT_TIMEOUT, 2))
             if response.status_code == 200:
+                self._last_health = (now, True)
                 return True
-            else:
-                self.server_running = False
-                if hasattr(self, 'root') and self.root:
-                    self.root.after_idle(lambda: self._update_server_status("Stopped"))
-                self.log_message("⚠️ Server is not responding")
-                return False
         except:
-            self.server_running = False
-            if hasattr(self, 'root') and self.root:
-                self.root.after_idle(lambda: self._update_server_status("Stopped"))
-            self.log_message("⚠️ Server is not responding")
-            return False
+            pass
+        
+        self.server_running = False
+        self._post_server_status("Stopped", "⚠️ Server is not responding")
+        return False
     
-    def _run_gui(self):
-        """Run the GUI in the main thread"""
+    def _build_gui(self):
+        """Build the GUI in the main thread"""
         self.root = tk.Tk()
         self.root.title("Rust Game Controller API")
         self.root.geometry("1200x700")
@@ -275,7 +522,7 @@ class RustControllerGUI:
         # Setup system tray
         self.setup_system_tray()
         
-        # Start log monitoring
+        # Show anything logged before the window existed, then keep polling from the Tk thread
         self.monitor_logs()
         
         # Handle window close and minimize
@@ -284,9 +531,6 @@ class RustControllerGUI:
         # Override minimize button to go to system tray
         self.root.bind("<Unmap>", self.on_minimize)
         
-        # Also handle the minimize button directly
-        self.root.bind("<Configure>", self.on_configure)
-        
         # Add keyboard shortcut for minimize to tray (Alt+M)
         self.root.bind("<Alt-m>", lambda e: self.minimize_to_tray())
         self.root.bind("<Alt-M>", lambda e: self.minimize_to_tray())
@@ -307,11 +551,6 @@ class RustControllerGUI:
         if should_start_minimized:
             # Small delay to ensure everything is ready, then minimize to tray
             self.root.after(500, self.minimize_to_tray)
-        
-
-        
-        # Start GUI main loop
-        self.root.mainloop()
     
 
     
@@ -323,32 +562,38 @@ class RustControllerGUI:
     
     def _background_task_loop(self):
         """Combined background task loop"""
-        last_stats_update = 0
-        last_server_check = 0
+        # Both checks are due on the first pass
+        last_stats_update = float('-inf')
+        last_server_check = float('-inf')
         
-        while not self.shutdown_event.is_set():
+        while True:
             try:
-                current_time = time.time()
+                # Sleep until the next check is due; wait() returns True as soon as shutdown is requested
+                current_time = time.monotonic()
+                timeout = max(0, min(self.STATS_INTERVAL - (current_time - last_stats_update),
+                                     self.SERVER_CHECK_INTERVAL - (current_time - last_server_check)))
+                if self.shutdown_event.wait(timeout):
+                    break
+                current_time = time.monotonic()
                 
                 # Update stats every 30 seconds
-                if current_time - last_stats_update >= 30:
+                if current_time - last_stats_update >= self.STATS_INTERVAL:
                     stats_data = self._fetch_database_stats()
-                    if hasattr(self, 'root') and self.root:
-                        self.root.after_idle(lambda: self._update_db_stats_display(stats_data))
+                    if self.root is not None:
+                        self._post_db_stats_display(stats_data)
                     last_stats_update = current_time
                 
                 # Check server status every 30 seconds
-                if current_time - last_server_check >= 30:
-                    if self.server_running and not self.check_server_status():
-                        if hasattr(self, 'root') and self.root:
-                            self.root.after_idle(lambda: self.log_message("⚠️ Server is not responding"))
+                if current_time - last_server_check >= self.SERVER_CHECK_INTERVAL:
+                    # check_server_status reports an outage itself, once per change
+                    if self.server_running:
+                        self.check_server_status()
                     last_server_check = current_time
                 
-                time.sleep(1)  # Check every second
-                
             except Exception as e:
                 print(f"Error in background task loop: {e}")
-                time.sleep(5)
+                if self.shutdown_event.wait(5):
+                    break
     
     def setup_logging(self):
         """Setup logging to capture all messages"""
@@ -358,9 +603,16 @@ class RustControllerGUI:
             datefmt='%H:%M:%S'
         )
         
-        # Setup queue handler
-        queue_handler = QueueHandler(self.log_queue)
-        queue_handler.setFormatter(formatter)
+        # Loggers only enqueue the raw record; the listener thread formats it
+        # and hands the text to the GUI log queue
+        raw_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(raw_queue)
+        
+        gui_handler = GUILogHandler(self.log_queue)
+        gui_handler.setFormatter(formatter)
+        
+        self.log_listener = logging.handlers.QueueListener(raw_queue, gui_handler, respect_handler_level=True)
+        self.log_listener.start()
         
         # Get root logger and add handler
         root_logger = logging.getLogger()
@@ -430,7 +682,7 @@ class RustControllerGUI:
         
         # API info
         api_info = ttk.Label(info_frame, 
-                            text="API URL: http://localhost:5000 | Health Check: http://localhost:5000/health")
+                            text=f"API URL: {BASE_URL} | Health Check: {HEALTH_URL}")
         api_info.pack(anchor=tk.W)
         
         # Database info
@@ -468,9 +720,10 @@ class RustControllerGUI:
         progress_label = ttk.Label(database_frame, textvariable=self.progress_label_var)
         progress_label.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(2, 0))
         
-        # API Testing Panel (right column) - hidden by default
+        # API Testing Panel (right column) - hidden by default and only built the first time it's shown
         self.api_panel_visible = False
-        self.create_api_testing_panel(main_frame)
+        self.api_frame = None
+        self._api_panel_parent = main_frame
     
     def create_menu_bar(self):
         """Create the menu bar with Server, API, and Launch options"""
@@ -525,8 +778,8 @@ class RustControllerGUI:
             if delay_ms > 0:
                 # Log that command is being delayed
                 self.log_message(f"Command delayed: {action.replace('_', ' ').title()} will execute in {delay_ms}ms")
-                # Schedule the API call with delay
-                self.root.after(delay_ms, lambda: self._execute_api_call(action, params))
+                # Schedule the API call with delay (still executed off the Tk thread)
+                self.root.after(delay_ms, self._dispatch_api_call, action, params)
                 return
             elif delay_ms < 0:
                 # Log warning for negative delay
@@ -537,82 +790,53 @@ class RustControllerGUI:
         
         # Execute immediately if no delay or negative delay
         # Show info for long-running operations
-        if action in ["stack_inventory", "cancel_all_crafting", "toggle_stack_inventory"]:
+        if action in LONG_RUNNING_ACTIONS:
             self.log_message(f"⏳ Starting {action.replace('_', ' ').title()} - this may take up to 2 minutes...")
         
-        # Run API call in background thread to prevent GUI freezing
-        threading.Thread(target=self._execute_api_call, args=(action, params), daemon=True).start()
+        # Run API call on the worker pool to prevent GUI freezing
+        self._dispatch_api_call(action, params)
+    
+    def _dispatch_api_call(self, action, params):
+        """Submit an API call unless an identical one is still running (called from main thread)"""
+        # Repeated clicks on the same button collapse into the request already on the wire
+        key = (action, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        if key in self._inflight_calls:
+            self.log_message(f"{action.replace('_', ' ').title()} is already running, ignoring repeated click")
+            return
+        self._inflight_calls.add(key)
+        future = self._api_executor.submit(self._execute_api_call, action, params)
+        # set.discard is atomic, so the worker thread can release the key itself
+        future.add_done_callback(lambda _: self._inflight_calls.discard(key))
+    
+    @staticmethod
+    def _filter_params(params):
+        """Drop None and empty-string values from request parameters"""
+        if not params:
+            return None
+        return {k: v for k, v in params.items() if v is not None and v != ""}
     
     def _execute_api_call(self, action, params):
         """Execute the actual API call"""
         try:
-            import json
-            
-            # Map action names to API endpoints
-            endpoint_map = {
-                "craft": "/craft/name",  # Changed from /craft to /craft/name
-                "cancel_craft": "/craft/cancel/name",  # Changed from /craft/cancel to /craft/cancel/name
-                "cancel_all_crafting": "/craft/cancel-all",
-                "suicide": "/player/suicide",
-                "kill": "/player/kill",
-                "respawn": "/player/respawn",
-                "respawn_only": "/player/respawn-only",
-                "respawn_random": "/player/respawn-random",
-                "respawn_bed": "/player/respawn-bed",
-                "gesture": "/player/gesture",
-                "auto_run": "/player/auto-run",
-                "auto_run_jump": "/player/auto-run-jump",
-                "auto_crouch_attack": "/player/auto-crouch-attack",
-                "global_chat": "/chat/global",
-                "team_chat": "/chat/team",
-                "quit_game": "/game/quit",
-                "disconnect": "/game/disconnect",
-                "connect": "/game/connect",
-                            "stack_inventory": "/inventory/stack",
-            "inventory_give": "/inventory/give",
-            "set_look_radius": "/settings/look-radius",
-            "set_voice_volume": "/settings/voice-volume",
-            "set_master_volume": "/settings/master-volume",
-            "set_hud_state": "/settings/hud",  # Changed from /settings/hud-state to /settings/hud
-            "copy_json": "/clipboard/copy-json",
-            "type_string": "/input/type-enter",  # Changed from /input/type to /input/type-enter
-            "start_anti_afk": "/anti-afk/start",
-            "stop_anti_afk": "/anti-afk/stop",
-            "toggle_stack_inventory": "/inventory/toggle-stack",
-                "noclip_toggle": "/player/noclip",
-                "god_mode_toggle": "/player/god-mode",
-                "set_time": "/player/set-time",
-                "teleport_to_marker": "/player/teleport-marker",
-                "toggle_combat_log": "/player/combat-log",
-                "clear_console": "/player/clear-console",
-                "toggle_console": "/player/toggle-console",
-                "ent_kill": "/player/ent-kill"
-            }
-            
-            endpoint = endpoint_map.get(action)
-            if not endpoint:
-                messagebox.showerror("Error", f"Unknown action: {action}")
+            url = URL_MAP.get(action)
+            if not url:
+                self.root.after_idle(messagebox.showerror, "Error", f"Unknown action: {action}")
                 return
             
-            url = f"http://localhost:5000{endpoint}"
-            
             # Determine timeout based on action type
             # Long-running operations need more time
-            if action in ["stack_inventory", "cancel_all_crafting", "toggle_stack_inventory", "inventory_give"]:
+            if action in LONG_RUNNING_ACTIONS:
                 timeout = 120  # 2 minutes for long operations
             else:
                 timeout = 5    # 5 seconds for regular operations
             
             # Prepare the request
-            if params:
-                # Filter out empty values
-                filtered_params = {k: v for k, v in params.items() if v is not None and v != ""}
-                if filtered_params:
-                    response = requests.post(url, json=filtered_params, timeout=timeout)
-                else:
-                    response = requests.post(url, timeout=timeout)
+            filtered_params = self._filter_params(params)
+            if filtered_params:
+                response = self.http.post(url, data=orjson.dumps(filtered_params), headers=JSON_HEADERS,
+                                          timeout=(CONNECT_TIMEOUT, timeout))
             else:
-                response = requests.post(url, timeout=timeout)
+                response = self.http.post(url, timeout=(CONNECT_TIMEOUT, timeout))
             
             if response.status_code == 200:
                 result = response.json()
@@ -623,90 +847,42 @@ class RustControllerGUI:
                     self.log_message(f"API Success: {action.replace('_', ' ').title()} - {result.get('message', 'Action completed successfully')}")
                 else:
                     # Use after_idle for GUI updates from background thread
-                    self.root.after_idle(lambda: messagebox.showerror("API Error", f"{action.replace('_', ' ').title()}: {result.get('message', 'Unknown error')}"))
+                    self.root.after_idle(messagebox.showerror, "API Error", f"{action.replace('_', ' ').title()}: {result.get('message', 'Unknown error')}")
             else:
                 # Use after_idle for GUI updates from background thread
-                self.root.after_idle(lambda: messagebox.showerror("HTTP Error", f"Server returned status code {response.status_code}"))
+                self.root.after_idle(messagebox.showerror, "HTTP Error", f"Server returned status code {response.status_code}")
                 
         except requests.exceptions.ConnectionError:
             # Use after_idle for GUI updates from background thread
-            self.root.after_idle(lambda: messagebox.showerror("Connection Error", "Could not connect to the server. Make sure it's running."))
+            self.root.after_idle(messagebox.showerror, "Connection Error", "Could not connect to the server. Make sure it's running.")
         except requests.exceptions.Timeout:
             # Use after_idle for GUI updates from background thread
-            self.root.after_idle(lambda: messagebox.showerror("Timeout Error", "Request timed out. The server may be busy."))
+            self.root.after_idle(messagebox.showerror, "Timeout Error", "Request timed out. The server may be busy.")
         except Exception as e:
             # Use after_idle for GUI updates from background thread
-            self.root.after_idle(lambda: messagebox.showerror("Error", f"An error occurred: {str(e)}"))
+            self.root.after_idle(messagebox.showerror, "Error", f"An error occurred: {str(e)}")
     
     def generate_curl_command(self, action, params):
         """Generate a Windows PowerShell compatible command for the given API call"""
-        # Map action names to API endpoints
-        endpoint_map = {
-            "craft": "/craft/name",
-            "cancel_craft": "/craft/cancel/name",
-            "cancel_all_crafting": "/craft/cancel-all",
-            "suicide": "/player/suicide",
-            "kill": "/player/kill",
-            "respawn": "/player/respawn",
-            "respawn_only": "/player/respawn-only",
-            "respawn_random": "/player/respawn-random",
-            "respawn_bed": "/player/respawn-bed",
-            "gesture": "/player/gesture",
-            "auto_run": "/player/auto-run",
-            "auto_run_jump": "/player/auto-run-jump",
-            "auto_crouch_attack": "/player/auto-crouch-attack",
-            "global_chat": "/chat/global",
-            "team_chat": "/chat/team",
-            "quit_game": "/game/quit",
-            "disconnect": "/game/disconnect",
-            "connect": "/game/connect",
-            "stack_inventory": "/inventory/stack",
-            "inventory_give": "/inventory/give",
-            "set_look_radius": "/settings/look-radius",
-            "set_voice_volume": "/settings/voice-volume",
-            "set_master_volume": "/settings/master-volume",
-            "set_hud_state": "/settings/hud",
-            "copy_json": "/clipboard/copy-json",
-            "type_string": "/input/type-enter",
-            "toggle_stack_inventory": "/inventory/toggle-stack",
-            "noclip_toggle": "/player/noclip",
-            "god_mode_toggle": "/player/god-mode",
-            "set_time": "/player/set-time",
-            "teleport_to_marker": "/player/teleport-marker",
-            "toggle_combat_log": "/player/combat-log",
-            "clear_console": "/player/clear-console",
-            "toggle_console": "/player/toggle-console",
-            "ent_kill": "/player/ent-kill"
-        }
-        
-        endpoint = endpoint_map.get(action)
-        if not endpoint:
+        ps_cmd = PS_COMMAND_MAP.get(action)
+        if not ps_cmd:
             return None
         
-        url = f"http://localhost:5000{endpoint}"
-        
-        # Build the PowerShell command
-        ps_cmd = f'Invoke-WebRequest -Uri "{url}" -Method POST'
-        
-        # Add headers
-        ps_cmd += ' -Headers @{"Content-Type"="application/json"}'
-        
         # Add JSON data if there are parameters
-        if params:
-            # Filter out empty values
-            filtered_params = {k: v for k, v in params.items() if v is not None and v != ""}
-            if filtered_params:
-                import json
-                json_data = json.dumps(filtered_params)
-                # For PowerShell, we need to escape single quotes and use single quotes around the JSON
-                json_data = json_data.replace("'", "''")
-                ps_cmd += f" -Body '{json_data}'"
+        filtered_params = self._filter_params(params)
+        if not filtered_params:
+            return ps_cmd
         
-        return ps_cmd
+        json_data = json.dumps(filtered_params, separators=(',', ':'))
+        # For PowerShell, we need to escape single quotes and use single quotes around the JSON
+        return "".join((ps_cmd, " -Body '", json_data.replace("'", "''"), "'"))
     
     def copy_curl_to_clipboard(self, action, params):
         """Generate PowerShell command and copy to clipboard"""
-        ps_cmd = self.generate_curl_command(action, params)
+        self._copy_powershell(action, self.generate_curl_command(action, params))
+    
+    def _copy_powershell(self, action, ps_cmd):
+        """Copy an already generated PowerShell command to the clipboard"""
         if ps_cmd:
             try:
                 pyperclip.copy(ps_cmd)
@@ -716,49 +892,105 @@ class RustControllerGUI:
         else:
             messagebox.showerror("Error", f"Could not generate PowerShell command for action: {action}")
 
-    def give_inventory_items(self):
-        """Give multiple items to inventory using the inventory give API"""
-        json_text = self.inventory_give_json_text.get("1.0", tk.END).strip()
+    def _api_cmd(self, action, payload):
+        """Button command that sends a fixed payload"""
+        return functools.partial(self.test_api_call, action, payload)
+    
+    def _copy_cmd(self, action, payload):
+        """Button command that copies the PowerShell command for a fixed payload"""
+        # The command text never changes, so render it once when the button is created
+        return functools.partial(self._copy_powershell, action, self.generate_curl_command(action, payload))
+    
+    def _api_var_cmd(self, action, *fields):
+        """Button command that sends a payload read from Tk variables at click time"""
+        return functools.partial(self._call_with_vars, self.test_api_call, action, fields)
+    
+    def _copy_var_cmd(self, action, *fields):
+        """Button command that copies the PowerShell command for a payload read from Tk variables"""
+        return functools.partial(self._call_with_vars, self.copy_curl_to_clipboard, action, fields)
+    
+    @staticmethod
+    def _call_with_vars(handler, action, fields):
+        """Build the payload from (key, variable[, cast]) fields and pass it to handler"""
+        params = {}
+        for key, var, *cast in fields:
+            value = var.get()
+            params[key] = cast[0](value) if cast else value
+        handler(action, params)
+    
+    def _build_action_row(self, parent, actions, pady=(0, 5)):
+        """Pack a row of (text, action) buttons, each followed by its Copy PowerShell button"""
+        row_frame = ttk.Frame(parent)
+        row_frame.pack(fill="x", pady=pady)
+        last = len(actions) - 1
+        for index, (text, action) in enumerate(actions):
+            ttk.Button(row_frame, text=text, 
+                      command=self._api_cmd(action, {})).pack(side=tk.LEFT, padx=(0, 5))
+            ttk.Button(row_frame, text="Copy PowerShell", 
+                      command=self._copy_cmd(action, {})).pack(side=tk.LEFT, padx=(0, 5) if index < last else 0)
+        return row_frame
+    
+    def _make_action_buttons(self, parent, action, field, text="Set"):
+        """Create an action button and its matching Copy PowerShell button"""
+        ttk.Button(parent, text=text, 
+                  command=self._api_var_cmd(action, field)).pack(side=tk.LEFT, padx=(0, 5))
+        
+        ttk.Button(parent, text="Copy PowerShell", 
+                  command=self._copy_var_cmd(action, field)).pack(side=tk.LEFT)
+    
+    def _make_toggle_row(self, parent, text, action, pady=(0, 5)):
+        """Pack a checkbox that sends {"enable": state} for action, plus its Copy PowerShell button"""
+        row_frame = ttk.Frame(parent)
+        row_frame.pack(fill="x", pady=pady)
+        
+        enable_var = tk.BooleanVar(value=False)
+        field = ("enable", enable_var)
+        ttk.Checkbutton(row_frame, text=text, variable=enable_var,
+                        command=self._api_var_cmd(action, field)).pack(side=tk.LEFT, padx=(0, 5))
+        
+        # Copies the command for whatever state the checkbox is showing
+        ttk.Button(row_frame, text="Copy PowerShell", 
+                  command=self._copy_var_cmd(action, field)).pack(side=tk.LEFT)
+        return enable_var
+    
+    def _parse_and_validate_inventory(self):
+        """Parse the inventory JSON box; return the items, or None after showing an error"""
+        json_text = self.inventory_give_json_text.get("1.0", "end-1c").strip()
         
         if not json_text:
             messagebox.showerror("Error", "Please enter JSON data")
-            return
+            return None
+        
+        # Send then Copy on unchanged text reuses the previous result
+        cached_text, cached_items = self._inventory_cache
+        if json_text == cached_text:
+            return cached_items
         
         try:
-            import json
-            items = json.loads(json_text)
-            
-            if not isinstance(items, list):
-                messagebox.showerror("Error", "JSON must be an array of objects")
-                return
-            
-            if not items:
-                messagebox.showerror("Error", "JSON array cannot be empty")
-                return
-            
-            # Validate each item
-            for i, item in enumerate(items):
-                if not isinstance(item, dict):
-                    messagebox.showerror("Error", f"Item {i} must be an object")
-                    return
-                
-                if 'item_name' not in item:
-                    messagebox.showerror("Error", f"Item {i} missing required field 'item_name'")
-                    return
-                
-                if 'quantity' in item and not isinstance(item['quantity'], (int, float)):
-                    messagebox.showerror("Error", f"Item {i} quantity must be a number")
-                    return
-                
-                if 'quantity' in item and item['quantity'] <= 0:
-                    messagebox.showerror("Error", f"Item {i} quantity must be greater than 0")
-                    return
-            
-        except json.JSONDecodeError as e:
+            items = orjson.loads(json_text)
+        # orjson is stricter than json: NaN/Infinity and numbers it can't represent are decode errors
+        except orjson.JSONDecodeError as e:
             messagebox.showerror("Error", f"Invalid JSON format: {str(e)}")
-            return
+            return None
         except Exception as e:
             messagebox.showerror("Error", f"Error parsing JSON: {str(e)}")
+            return None
+        
+        # Report every problem in one dialog
+        errors = validate_inventory_items(items)
+        if errors:
+            if len(errors) > 20:
+                errors = errors[:20] + [f"... and {len(errors) - 20} more"]
+            messagebox.showerror("Error", "\n".join(errors))
+            return None
+        
+        self._inventory_cache = (json_text, items)
+        return items
+    
+    def give_inventory_items(self):
+        """Give multiple items to inventory using the inventory give API"""
+        items = self._parse_and_validate_inventory()
+        if items is None:
             return
         
         # Call the API
@@ -766,47 +998,8 @@ class RustControllerGUI:
     
     def copy_inventory_give_curl(self):
         """Copy the inventory give PowerShell command to clipboard"""
-        json_text = self.inventory_give_json_text.get("1.0", tk.END).strip()
-        
-        if not json_text:
-            messagebox.showerror("Error", "Please enter JSON data")
-            return
-        
-        try:
-            import json
-            items = json.loads(json_text)
-            
-            if not isinstance(items, list):
-                messagebox.showerror("Error", "JSON must be an array of objects")
-                return
-            
-            if not items:
-                messagebox.showerror("Error", "JSON array cannot be empty")
-                return
-            
-            # Validate each item
-            for i, item in enumerate(items):
-                if not isinstance(item, dict):
-                    messagebox.showerror("Error", f"Item {i} must be an object")
-                    return
-                
-                if 'item_name' not in item:
-                    messagebox.showerror("Error", f"Item {i} missing required field 'item_name'")
-                    return
-                
-                if 'quantity' in item and not isinstance(item['quantity'], (int, float)):
-                    messagebox.showerror("Error", f"Item {i} quantity must be a number")
-                    return
-                
-                if 'quantity' in item and item['quantity'] <= 0:
-                    messagebox.showerror("Error", f"Item {i} quantity must be greater than 0")
-                    return
-            
-        except json.JSONDecodeError as e:
-            messagebox.showerror("Error", f"Invalid JSON format: {str(e)}")
-            return
-        except Exception as e:
-            messagebox.showerror("Error", f"Error parsing JSON: {str(e)}")
+        items = self._parse_and_validate_inventory()
+        if items is None:
             return
         
         # Generate and copy the PowerShell command
@@ -814,8 +1007,9 @@ class RustControllerGUI:
     
     def clear_inventory_json(self):
         """Clear the JSON input text box"""
+        self._inventory_cache = (None, None)
         self.inventory_give_json_text.delete("1.0", tk.END)
-        self.inventory_give_json_text.insert(tk.END, '[{"item_name": "wood", "quantity": 1000}]')
+        self.inventory_give_json_text.insert(tk.END, DEFAULT_GIVE_JSON)
 
     
 
@@ -824,34 +1018,42 @@ class RustControllerGUI:
     
     def refresh_item_dropdowns(self):
         """Refresh the item dropdowns with data from the database"""
+        # Collapse bursts of refresh requests into a single fetch
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after(self.REFRESH_DEBOUNCE_MS, self._fetch_item_dropdowns)
+    
+    def _fetch_item_dropdowns(self):
+        """Start the craftable-items request for the dropdowns (called from main thread)"""
+        self._refresh_pending = False
+        # Get craftable items from the API database (only items with ingredients) off the Tk thread
+        # Revalidate against the last response so an unchanged list comes back as a bodyless 304
+        headers = {"If-None-Match": self._items_etag} if self._items_etag else None
+        future = self._api_executor.submit(self.http.get, CRAFTABLE_ITEMS_URL, headers=headers,
+                                           timeout=(CONNECT_TIMEOUT, 5))
+        future.add_done_callback(functools.partial(self._deliver_future, self._apply_item_dropdowns))
+    
+    def _apply_item_dropdowns(self, future):
+        """Fill the item dropdowns from a finished craftable-items request (called from main thread)"""
         try:
-            # Get craftable items from the API database (only items with ingredients)
-            response = requests.get("http://localhost:5000/steam/craftable-items", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
+            response = future.result()
+            if response.status_code == 304:
+                # Dropdowns already hold this list
+                self.log_message(f"Dropdown Refresh: {len(self._item_names)} craftable items unchanged")
+            elif response.status_code == 200:
+                data = orjson.loads(response.content)
                 if data.get('success') and data.get('items'):
-                    # Extract item names and sort them
-                    item_names = []
-                    items_dict = data['items']
-                    
+                    # Extract unique item names and sort them alphabetically
                     # Handle dictionary format from API data manager
-                    for item_id, item_data in items_dict.items():
-                        if isinstance(item_data, dict):
-                            name = item_data.get('name', '')
-                            if name and name not in item_names:
-                                item_names.append(name)
-                    
-                    item_names.sort()  # Sort alphabetically
+                    item_names = tuple(sorted({item_data.get('name') for item_data in data['items'].values()
+                                               if isinstance(item_data, dict) and item_data.get('name')}))
                     
-                    # Update both dropdowns
-                    self.craft_name_combo['values'] = item_names
-                    self.cancel_name_combo['values'] = item_names
-                    
-                    # Set default values if empty
-                    if not self.craft_name_var.get() and item_names:
-                        self.craft_name_var.set(item_names[0])
-                    if not self.cancel_name_var.get() and item_names:
-                        self.cancel_name_var.set(item_names[0])
+                    # Update both dropdowns, skipping the Tcl list rebuild when nothing changed
+                    if item_names != self._item_names:
+                        self._item_names = item_names
+                        self._fill_item_dropdowns()
+                    self._items_etag = response.headers.get('ETag')
                     
                     # Log success to server logs instead of showing popup
                     self.log_message(f"Dropdown Refresh: Loaded {len(item_names)} craftable items into dropdowns")
@@ -868,14 +1070,34 @@ class RustControllerGUI:
             import traceback
             print(f"Full error: {traceback.format_exc()}")
     
+    def _fill_item_dropdowns(self):
+        """Load the cached item names into the crafting dropdowns, if the API panel exists"""
+        if self.api_frame is None:
+            return
+        item_names = self._item_names
+        self.craft_name_combo.configure(values=item_names)
+        self.cancel_name_combo.configure(values=item_names)
+        
+        # Set default values if empty
+        if not self.craft_name_var.get() and item_names:
+            self.craft_name_var.set(item_names[0])
+        if not self.cancel_name_var.get() and item_names:
+            self.cancel_name_var.set(item_names[0])
+    
+    def _set_anti_afk_status(self, status):
+        """Show the anti-AFK status, skipping the Tk update when it hasn't changed"""
+        if status != self._anti_afk_status:
+            self._anti_afk_status = status
+            self.anti_afk_status_var.set(status)
+    
     def start_anti_afk(self):
         """Start the anti-AFK feature"""
         try:
-            response = requests.post("http://localhost:5000/anti-afk/start", timeout=5)
+            response = self.http.post(URL_MAP["start_anti_afk"], timeout=(CONNECT_TIMEOUT, 5))
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 if result.get('success'):
-                    self.anti_afk_status_var.set("Status: Running")
+                    self._set_anti_afk_status("Status: Running")
                     self.log_message("✅ Anti-AFK started successfully")
                 else:
                     self.log_message(f"❌ Failed to start Anti-AFK: {result.get('message', 'Unknown error')}")
@@ -887,11 +1109,11 @@ class RustControllerGUI:
     def stop_anti_afk(self):
         """Stop the anti-AFK feature"""
         try:
-            response = requests.post("http://localhost:5000/anti-afk/stop", timeout=5)
+            response = self.http.post(URL_MAP["stop_anti_afk"], timeout=(CONNECT_TIMEOUT, 5))
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 if result.get('success'):
-                    self.anti_afk_status_var.set("Status: Stopped")
+                    self._set_anti_afk_status("Status: Stopped")
                     self.log_message("✅ Anti-AFK stopped successfully")
                 else:
                     self.log_message(f"❌ Failed to stop Anti-AFK: {result.get('message', 'Unknown error')}")
@@ -903,16 +1125,16 @@ class RustControllerGUI:
     def check_anti_afk_status(self):
         """Check the current anti-AFK status"""
         try:
-            response = requests.get("http://localhost:5000/anti-afk/status", timeout=5)
+            response = self.http.get(ANTI_AFK_STATUS_URL, timeout=(CONNECT_TIMEOUT, 5))
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 if result.get('success'):
                     is_running = result.get('running', False)
                     if is_running:
-                        self.anti_afk_status_var.set("Status: Running")
+                        self._set_anti_afk_status("Status: Running")
                         self.log_message("✅ Anti-AFK is currently running")
                     else:
-                        self.anti_afk_status_var.set("Status: Stopped")
+                        self._set_anti_afk_status("Status: Stopped")
                         self.log_message("ℹ️ Anti-AFK is not running")
                 else:
                     self.log_message(f"❌ Failed to get Anti-AFK status: {result.get('message', 'Unknown error')}")
@@ -923,6 +1145,14 @@ class RustControllerGUI:
     
     def setup_system_tray(self):
         """Setup system tray icon and menu"""
+        # Icon decoding happens on the tray thread so it doesn't delay the first window paint;
+        # tray_icon stays None until it's built
+        self.tray_icon = None
+        self.tray_thread = threading.Thread(target=self._run_tray, daemon=True)
+        self.tray_thread.start()
+    
+    def _run_tray(self):
+        """Build the system tray icon and run it (called from tray thread)"""
         # Create system tray icon - standard approach
         try:
             # Check if we're running as an executable
@@ -937,28 +1167,9 @@ class RustControllerGUI:
                     icon_path = os.path.join(base_path, icon_name)
                     if os.path.exists(icon_path):
                         try:
-                            self.icon_image = Image.open(icon_path)
-                            
-                            # Handle different image modes for better transparency
-                            if icon_name.endswith('.ico'):
-                                # ICO files often have transparency - preserve it
-                                if self.icon_image.mode in ['RGBA', 'LA', 'P']:
-                                    # Keep transparency for ICO files
-                                    pass
-                                elif self.icon_image.mode != 'RGB':
-                                    # Convert other modes to RGB
-                                    self.icon_image = self.icon_image.convert('RGB')
-                            else:
-                                # PNG files - preserve transparency if present
-                                if self.icon_image.mode in ['RGBA', 'LA']:
-                                    # Keep transparency for PNG files
-                                    pass
-                                elif self.icon_image.mode != 'RGB':
-                                    # Convert other modes to RGB
-                                    self.icon_image = self.icon_image.convert('RGB')
-                            
-                            # Resize to appropriate size for system tray
-                            self.icon_image = self.icon_image.resize((64, 64), Image.Resampling.LANCZOS)
+                            # ICO files often have palette transparency; PNGs keep only alpha modes
+                            keep_modes = ('RGBA', 'LA', 'P') if icon_name.endswith('.ico') else ('RGBA', 'LA')
+                            self.icon_image = _load_tray_icon(icon_path, keep_modes)
                             self.log_message(f"✅ Using bundled {icon_name} for system tray icon (mode: {self.icon_image.mode})")
                             icon_found = True
                             break
@@ -993,26 +1204,12 @@ class RustControllerGUI:
             else:
                 # Running as script - try to load icon files from current directory
                 if os.path.exists("rust_controller.ico"):
-                    self.icon_image = Image.open("rust_controller.ico")
                     # Preserve transparency for ICO files
-                    if self.icon_image.mode in ['RGBA', 'LA', 'P']:
-                        # Keep transparency
-                        pass
-                    elif self.icon_image.mode != 'RGB':
-                        self.icon_image = self.icon_image.convert('RGB')
-                    # Resize to appropriate size for system tray
-                    self.icon_image = self.icon_image.resize((64, 64), Image.Resampling.LANCZOS)
+                    self.icon_image = _load_tray_icon("rust_controller.ico", ('RGBA', 'LA', 'P'))
                     self.log_message(f"✅ Using rust_controller.ico for system tray icon (mode: {self.icon_image.mode})")
                 elif os.path.exists("camera.ico"):
-                    self.icon_image = Image.open("camera.ico")
                     # Preserve transparency for ICO files
-                    if self.icon_image.mode in ['RGBA', 'LA', 'P']:
-                        # Keep transparency
-                        pass
-                    elif self.icon_image.mode != 'RGB':
-                        self.icon_image = self.icon_image.convert('RGB')
-                    # Resize to appropriate size for system tray
-                    self.icon_image = self.icon_image.resize((64, 64), Image.Resampling.LANCZOS)
+                    self.icon_image = _load_tray_icon("camera.ico", ('RGBA', 'LA', 'P'))
                     self.log_message(f"✅ Using camera.ico for system tray icon (mode: {self.icon_image.mode})")
                 else:
                     # Create a simple colored square as fallback
@@ -1040,10 +1237,7 @@ class RustControllerGUI:
         # Create system tray icon
         self.tray_icon = pystray.Icon("camera_controller", self.icon_image, 
                                      "Rust Game Controller API", menu)
-        
-        # Start system tray in a separate thread
-        self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
-        self.tray_thread.start()
+        self.tray_icon.run()
     
     def start_server(self):
         """Start the Flask server"""
@@ -1065,48 +1259,50 @@ class RustControllerGUI:
             self.server_thread = threading.Thread(target=run_flask_server, daemon=True)
             self.server_thread.start()
             
-            # Wait a moment for the server to start
-            time.sleep(2)
-            
-            # Check if the server is responding
-            try:
-                response = requests.get("http://localhost:5000/health", timeout=5)
-                if response.status_code == 200:
-                    self.server_running = True
-                    self.log_message("✅ API server started successfully on http://localhost:5000")
-                    # Update GUI status if GUI is ready
-                    if hasattr(self, 'root') and self.root:
-                        self.root.after_idle(lambda: self._update_server_status("Running"))
-                else:
-                    self.log_message("❌ Server started but not responding properly")
-            except:
-                self.log_message("❌ Server failed to start or respond")
+            # Poll /health instead of sleeping blindly. Once the GUI exists (menu or
+            # tray "Start Server") the poll runs on the API pool; during startup
+            # __init__ calls wait_for_server_ready itself.
+            if self.root is not None:
+                self._api_executor.submit(self.wait_for_server_ready)
             
         except Exception as e:
             self.log_message(f"❌ Failed to start server: {e}")
-            if hasattr(self, 'root') and self.root:
-                self.root.after_idle(lambda: messagebox.showerror("Error", f"Failed to start server: {e}"))
+            if self.root is not None:
+                self.root.after_idle(messagebox.showerror, "Error", f"Failed to start server: {e}")
     
     def wait_for_server_ready(self):
         """Wait for the server to be fully ready and responding"""
         self.log_message("Waiting for server to be ready...")
-        max_attempts = 30  # Wait up to 30 seconds
-        attempt = 0
+        start = time.monotonic()
+        deadline = start + 30  # Wait up to 30 seconds
+        next_report = start + 5
+        # Poll quickly at first so a fast start is noticed within tens of ms
+        delay = 0.025
         
-        while attempt < max_attempts:
+        while time.monotonic() < deadline:
             try:
-                response = requests.get("http://localhost:5000/health", timeout=2)
+                response = self.http.get(HEALTH_URL, timeout=(CONNECT_TIMEOUT, 2))
                 if response.status_code == 200:
                     self.server_running = True
                     self.log_message("✅ Server is ready and responding")
+                    # Update GUI status if GUI is ready
+                    self._post_server_status("Running")
                     return True
             except:
                 pass
             
-            attempt += 1
-            time.sleep(1)
-            if attempt % 5 == 0:  # Log every 5 seconds
-                self.log_message(f"Still waiting for server... ({attempt}s)")
+            # Flask exits its thread straight away when it fails to start (e.g. port in use)
+            if not self.server_thread.is_alive():
+                self.log_message("❌ Server failed to start")
+                return False
+            
+            if self.shutdown_event.wait(delay):
+                return False
+            delay = min(delay * 2, 0.5)
+            now = time.monotonic()
+            if now >= next_report:  # Log every 5 seconds
+                self.log_message(f"Still waiting for server... ({int(now - start)}s)")
+                next_report += 5
         
         self.log_message("❌ Server failed to become ready within timeout")
         return False
@@ -1114,7 +1310,7 @@ class RustControllerGUI:
     def _test_server_health(self):
         """Test if the server is responding"""
         try:
-            response = requests.get("http://localhost:5000/health", timeout=5)
+            response = self.http.get(HEALTH_URL, timeout=(CONNECT_TIMEOUT, 5))
             if response.status_code == 200:
                 self.log_message("✅ Server health check passed")
             else:
@@ -1122,10 +1318,22 @@ class RustControllerGUI:
         except Exception as e:
             self.log_message(f"⚠️ Server health check failed: {e}")
     
+    def _post_server_status(self, status, message=None):
+        """Schedule a server status update, and log message, if the status changed (any thread)"""
+        if status == self._server_status:
+            return
+        if message:
+            self.log_message(message)
+        if self.root is None:
+            return
+        self._server_status = status
+        self.root.after_idle(self._update_server_status, status)
+    
     def _update_server_status(self, status):
         """Update server status in GUI (called from main thread)"""
+        self._server_status = status
         # Update menu states based on server status
-        if hasattr(self, 'server_menu'):
+        if self.server_menu is not None:
             if status == "Running":
                 self.server_menu.entryconfig(0, state="disabled")  # Start Server
                 self.server_menu.entryconfig(1, state="normal")    # Stop Server
@@ -1144,20 +1352,19 @@ class RustControllerGUI:
             self.server_running = False
             
             # Update GUI if it's ready
-            if hasattr(self, 'root') and self.root:
-                self.root.after_idle(lambda: self._update_server_status("Stopped"))
+            self._post_server_status("Stopped")
             
             self.log_message("Server stopped")
             
         except Exception as e:
             self.log_message(f"Failed to stop server: {e}")
-            if hasattr(self, 'root') and self.root:
-                self.root.after_idle(lambda: messagebox.showerror("Error", f"Failed to stop server: {e}"))
+            if self.root is not None:
+                self.root.after_idle(messagebox.showerror, "Error", f"Failed to stop server: {e}")
     
     def open_api(self):
         """Open the API in default browser"""
         try:
-            webbrowser.open("http://localhost:5000/health")
+            webbrowser.open(HEALTH_URL)
         except Exception as e:
             self.log_message(f"Failed to open API: {e}")
     
@@ -1168,14 +1375,15 @@ class RustControllerGUI:
         self.log_queue.put(formatted_message)
     
     def monitor_logs(self):
-        """Monitor log queue and update GUI"""
+        """Monitor log queue and update GUI (called from main thread)"""
+        messages = []
         try:
             # Process all available messages at once
-            messages = []
+            append = messages.append
+            get_nowait = self.log_queue.get_nowait
             while True:
                 try:
-                    message = self.log_queue.get_nowait()
-                    messages.append(message)
+                    append(get_nowait())
                 except queue.Empty:
                     break
             
@@ -1187,16 +1395,21 @@ class RustControllerGUI:
                 if self.auto_scroll_var.get():
                     self.log_text.see(tk.END)
                 
-                # Limit log size (only check occasionally)
-                lines = self.log_text.get("1.0", tk.END).split("\n")
-                if len(lines) > 1000:
+                # Limit log size; the end index gives the line count without copying the buffer
+                line_count = int(self.log_text.index("end-1c").split(".", 1)[0])
+                if line_count > 1000:
                     self.log_text.delete("1.0", "500.0")
                         
         except Exception as e:
             print(f"Error monitoring logs: {e}")
         
-        # Schedule next check (further reduced frequency)
-        self.root.after(1000, self.monitor_logs)
+        # Poll quickly while lines are arriving and back off while the queue is idle;
+        # only the Tk thread ever schedules this, so writers just put onto log_queue
+        if messages:
+            self._log_poll_ms = self.LOG_BATCH_MS
+        else:
+            self._log_poll_ms = min(self._log_poll_ms * 2, self.LOG_IDLE_MS)
+        self.root.after(self._log_poll_ms, self.monitor_logs)
     
     def clear_logs(self):
         """Clear the log display"""
@@ -1205,15 +1418,18 @@ class RustControllerGUI:
     def save_logs(self):
         """Save logs to file"""
         try:
-            from tkinter import filedialog
             filename = filedialog.asksaveasfilename(
                 defaultextension=".txt",
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
             
             if filename:
+                # Copy the buffer out of Tk a block of lines at a time rather than as one huge string
+                last_line = int(self.log_text.index("end-1c").split(".", 1)[0])
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.get("1.0", tk.END))
+                    for start in range(1, last_line + 1, self.SAVE_CHUNK_LINES):
+                        # Indexes past the end clamp to the end of the text
+                        f.write(self.log_text.get(f"{start}.0", f"{start + self.SAVE_CHUNK_LINES}.0"))
                 
                 self.log_message(f"Logs saved to {filename}")
                 
@@ -1221,56 +1437,54 @@ class RustControllerGUI:
             self.log_message(f"Failed to save logs: {e}")
             messagebox.showerror("Error", f"Failed to save logs: {e}")
     
+    def _deliver_future(self, handler, future):
+        """Hand a finished Future to handler on the main thread (called from worker thread)"""
+        if not future.cancelled() and self.root is not None:
+            self.root.after(0, handler, future)
+    
+    def _on_stats_fetched(self, future):
+        """Hand a background stats fetch back to the main thread"""
+        if not future.cancelled():
+            self._post_db_stats_display(future.result())
+    
+    def _post_db_stats_display(self, text):
+        """Schedule a stats display update, coalescing with one already pending (any thread)"""
+        with self._pending_stats_lock:
+            already_scheduled = self._pending_stats is not None
+            self._pending_stats = text
+        if not already_scheduled:
+            self.root.after_idle(self._apply_pending_stats)
+    
+    def _apply_pending_stats(self):
+        """Apply the latest posted stats text (called from main thread)"""
+        with self._pending_stats_lock:
+            text, self._pending_stats = self._pending_stats, None
+        if text is not None:
+            self._update_db_stats_display(text)
+    
     def _update_db_stats_display(self, text):
         """Update database stats display (called from main thread)"""
-        if hasattr(self, 'db_stats_var'):
+        if self.db_stats_var is not None and self.db_stats_var.get() != text:
             self.db_stats_var.set(text)
     
     def check_startup_enabled(self):
         """Check if the app is enabled to start with Windows"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                               r"Software\Microsoft\Windows\CurrentVersion\Run", 
-                               0, winreg.KEY_READ)
-            winreg.QueryValueEx(key, "RustGameController")
-            winreg.CloseKey(key)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
+                                r"Software\Microsoft\Windows\CurrentVersion\Run", 
+                                0, winreg.KEY_READ) as key:
+                winreg.QueryValueEx(key, "RustGameController")
             return True
         except:
             return False
     
-    def update_startup_command(self):
-        """Update the startup command in registry"""
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                               r"Software\Microsoft\Windows\CurrentVersion\Run", 
-                               0, winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE)
-            
-            app_path = sys.argv[0]
-            if app_path.endswith('.py'):
-                # If running as script, use python executable
-                app_path = f'"{sys.executable}" "{app_path}"'
-            else:
-                # If running as exe
-                app_path = f'"{app_path}"'
-            
-            # Add start minimized parameter if enabled
-            if self.check_start_minimized_enabled():
-                app_path += ' --minimized'
-            
-            winreg.SetValueEx(key, "RustGameController", 0, winreg.REG_SZ, app_path)
-            winreg.CloseKey(key)
-            
-        except Exception as e:
-            self.log_message(f"Failed to update startup command: {e}")
-    
     def check_start_minimized_enabled(self):
         """Check if the app is set to start minimized"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                               r"Software\RustGameController", 
-                               0, winreg.KEY_READ)
-            value, _ = winreg.QueryValueEx(key, "StartMinimized")
-            winreg.CloseKey(key)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
+                                r"Software\RustGameController", 
+                                0, winreg.KEY_READ) as key:
+                value, _ = winreg.QueryValueEx(key, "StartMinimized")
             return bool(value)
         except FileNotFoundError:
             # Key doesn't exist, return False
@@ -1290,9 +1504,10 @@ class RustControllerGUI:
         scrollbar = ttk.Scrollbar(self.api_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
+        # The frame is the canvas's only item, anchored at the origin, so its new size is the scroll region
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -1331,10 +1546,10 @@ class RustControllerGUI:
         ttk.Entry(craft_id_frame, textvariable=self.craft_quantity_var, width=5).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(craft_id_frame, text="Craft", 
-                  command=lambda: self.test_api_call("craft", {"item_id": self.craft_id_var.get(), "quantity": self.craft_quantity_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("craft", ("item_id", self.craft_id_var), ("quantity", self.craft_quantity_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(craft_id_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("craft", {"item_id": self.craft_id_var.get(), "quantity": self.craft_quantity_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("craft", ("item_id", self.craft_id_var), ("quantity", self.craft_quantity_var))).pack(side=tk.LEFT)
         
         # Craft by Name
         ttk.Label(crafting_frame, text="Craft by Name:").pack(anchor=tk.W, pady=(10, 0))
@@ -1349,10 +1564,10 @@ class RustControllerGUI:
         ttk.Entry(craft_name_frame, textvariable=self.craft_name_quantity_var, width=5).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(craft_name_frame, text="Craft", 
-                  command=lambda: self.test_api_call("craft", {"item_name": self.craft_name_var.get(), "quantity": self.craft_name_quantity_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("craft", ("item_name", self.craft_name_var), ("quantity", self.craft_name_quantity_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(craft_name_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("craft", {"item_name": self.craft_name_var.get(), "quantity": self.craft_name_quantity_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("craft", ("item_name", self.craft_name_var), ("quantity", self.craft_name_quantity_var))).pack(side=tk.LEFT)
         
         # Refresh items button
         ttk.Button(craft_name_frame, text="Refresh", 
@@ -1370,10 +1585,10 @@ class RustControllerGUI:
         ttk.Entry(cancel_id_frame, textvariable=self.cancel_quantity_var, width=5).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(cancel_id_frame, text="Cancel", 
-                  command=lambda: self.test_api_call("cancel_craft", {"item_id": self.cancel_id_var.get(), "quantity": self.cancel_quantity_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("cancel_craft", ("item_id", self.cancel_id_var), ("quantity", self.cancel_quantity_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(cancel_id_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("cancel_craft", {"item_id": self.cancel_id_var.get(), "quantity": self.cancel_quantity_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("cancel_craft", ("item_id", self.cancel_id_var), ("quantity", self.cancel_quantity_var))).pack(side=tk.LEFT)
         
         # Cancel Craft by Name
         ttk.Label(crafting_frame, text="Cancel Craft by Name:").pack(anchor=tk.W, pady=(10, 0))
@@ -1388,10 +1603,10 @@ class RustControllerGUI:
         ttk.Entry(cancel_name_frame, textvariable=self.cancel_name_quantity_var, width=5).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(cancel_name_frame, text="Cancel", 
-                  command=lambda: self.test_api_call("cancel_craft", {"item_name": self.cancel_name_var.get(), "quantity": self.cancel_name_quantity_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("cancel_craft", ("item_name", self.cancel_name_var), ("quantity", self.cancel_name_quantity_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(cancel_name_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("cancel_craft", {"item_name": self.cancel_name_var.get(), "quantity": self.cancel_name_quantity_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("cancel_craft", ("item_name", self.cancel_name_var), ("quantity", self.cancel_name_quantity_var))).pack(side=tk.LEFT)
         
         # Cancel All Crafting
         cancel_all_frame = ttk.Frame(crafting_frame)
@@ -1402,10 +1617,10 @@ class RustControllerGUI:
         ttk.Entry(cancel_all_frame, textvariable=self.cancel_iterations_var, width=8).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(cancel_all_frame, text="Cancel All Crafting", 
-                  command=lambda: self.test_api_call("cancel_all_crafting", {"iterations": int(self.cancel_iterations_var.get())})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("cancel_all_crafting", ("iterations", self.cancel_iterations_var, int))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(cancel_all_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("cancel_all_crafting", {"iterations": int(self.cancel_iterations_var.get())})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("cancel_all_crafting", ("iterations", self.cancel_iterations_var, int))).pack(side=tk.LEFT)
         
         # Stack Inventory
         stack_inventory_frame = ttk.Frame(crafting_frame)
@@ -1416,26 +1631,13 @@ class RustControllerGUI:
         ttk.Entry(stack_inventory_frame, textvariable=self.stack_iterations_var, width=8).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(stack_inventory_frame, text="Stack Inventory", 
-                  command=lambda: self.test_api_call("stack_inventory", {"iterations": int(self.stack_iterations_var.get())})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("stack_inventory", ("iterations", self.stack_iterations_var, int))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(stack_inventory_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("stack_inventory", {"iterations": int(self.stack_iterations_var.get())})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("stack_inventory", ("iterations", self.stack_iterations_var, int))).pack(side=tk.LEFT)
         
         # Toggle Stack Inventory
-        toggle_stack_frame = ttk.Frame(crafting_frame)
-        toggle_stack_frame.pack(fill="x", pady=(10, 0))
-        
-        ttk.Button(toggle_stack_frame, text="Enable Continuous Stack", 
-                  command=lambda: self.test_api_call("toggle_stack_inventory", {"enable": True})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(toggle_stack_frame, text="Disable Continuous Stack", 
-                  command=lambda: self.test_api_call("toggle_stack_inventory", {"enable": False})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(toggle_stack_frame, text="Copy Enable PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("toggle_stack_inventory", {"enable": True})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(toggle_stack_frame, text="Copy Disable PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("toggle_stack_inventory", {"enable": False})).pack(side=tk.LEFT)
+        self.stack_toggle_var = self._make_toggle_row(crafting_frame, "Continuous Stack", "toggle_stack_inventory", pady=(10, 0))
         
         # Inventory Give Section
         inventory_give_frame = ttk.Frame(crafting_frame)
@@ -1448,10 +1650,9 @@ class RustControllerGUI:
         json_frame = ttk.Frame(inventory_give_frame)
         json_frame.pack(fill="x", pady=(0, 5))
         
-        self.inventory_give_json_var = tk.StringVar(value='[{"item_name": "wood", "quantity": 1000}]')
         self.inventory_give_json_text = scrolledtext.ScrolledText(json_frame, height=4, width=50)
         self.inventory_give_json_text.pack(fill="x", expand=True)
-        self.inventory_give_json_text.insert(tk.END, self.inventory_give_json_var.get())
+        self.inventory_give_json_text.insert(tk.END, DEFAULT_GIVE_JSON)
         
         # Buttons
         buttons_frame = ttk.Frame(inventory_give_frame)
@@ -1474,35 +1675,9 @@ class RustControllerGUI:
         suicide_respawn_frame = ttk.Frame(player_frame)
         suicide_respawn_frame.pack(fill="x", pady=(0, 5))
         
-        # Row 1: Suicide (just kill)
-        row1_frame = ttk.Frame(suicide_respawn_frame)
-        row1_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(row1_frame, text="Suicide (just kill)", 
-                  command=lambda: self.test_api_call("kill", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(row1_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("kill", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Row 2: Random spawn (just respawn)
-        row2_frame = ttk.Frame(suicide_respawn_frame)
-        row2_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(row2_frame, text="Random spawn (just respawn)", 
-                  command=lambda: self.test_api_call("respawn_only", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(row2_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("respawn_only", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Row 3: Respawn random (kill and respawn)
-        row3_frame = ttk.Frame(suicide_respawn_frame)
-        row3_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(row3_frame, text="Respawn random (kill and respawn)", 
-                  command=lambda: self.test_api_call("respawn_random", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(row3_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("respawn_random", {})).pack(side=tk.LEFT, padx=(0, 5))
+        # Rows 1-3: Suicide, random spawn, and kill + random respawn
+        for actions in self.RESPAWN_ROWS:
+            self._build_action_row(suicide_respawn_frame, actions)
         
         # Row 4: Respawn bed (kill and respawn_sleepingbag <id>)
         row4_frame = ttk.Frame(suicide_respawn_frame)
@@ -1514,32 +1689,13 @@ class RustControllerGUI:
         ttk.Entry(row4_frame, textvariable=self.respawn_bed_id_var, width=10).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(row4_frame, text="Respawn bed (kill and respawn_sleepingbag <id>)", 
-                  command=lambda: self.test_api_call("respawn_bed", {"spawn_id": self.respawn_bed_id_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("respawn_bed", ("spawn_id", self.respawn_bed_id_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(row4_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("respawn_bed", {"spawn_id": self.respawn_bed_id_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._copy_var_cmd("respawn_bed", ("spawn_id", self.respawn_bed_id_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         # Movement Actions
-        movement_frame = ttk.Frame(player_frame)
-        movement_frame.pack(fill="x", pady=(5, 0))
-        
-        ttk.Button(movement_frame, text="Auto Run", 
-                  command=lambda: self.test_api_call("auto_run", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(movement_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("auto_run", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(movement_frame, text="Auto Run & Jump", 
-                  command=lambda: self.test_api_call("auto_run_jump", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(movement_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("auto_run_jump", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(movement_frame, text="Auto Crouch & Attack", 
-                  command=lambda: self.test_api_call("auto_crouch_attack", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(movement_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("auto_crouch_attack", {})).pack(side=tk.LEFT)
+        self._build_action_row(player_frame, self.MOVEMENT_ACTIONS, pady=(5, 0))
         
         # Emotes Section
         emote_frame = ttk.Frame(player_frame)
@@ -1547,63 +1703,25 @@ class RustControllerGUI:
         
         ttk.Label(emote_frame, text="Emotes:").pack(side=tk.LEFT, padx=(0, 5))
         
-        # Define available emotes
-        self.emotes = [
-            "wave", "victory", "shrug", "thumbsup", "hurry", "ok", "thumbsdown", 
-            "clap", "point", "friendly", "cabbagepatch", "twist", "raisetheroof", 
-            "beatchest", "throatcut", "fingergun", "shush", "shush_vocal", 
-            "watchingyou", "loser", "nono", "knucklescrack", "rps"
-        ]
-        
-        self.emote_var = tk.StringVar()
-        self.emote_combo = ttk.Combobox(emote_frame, textvariable=self.emote_var, values=self.emotes, width=15, state="readonly")
+        self.emote_var = tk.StringVar(value=self.EMOTES[0])
+        self.emote_combo = ttk.Combobox(emote_frame, textvariable=self.emote_var, values=self.EMOTES, width=15, state="readonly")
         self.emote_combo.pack(side=tk.LEFT, padx=(0, 5))
         
-        # Set default value
-        if self.emotes:
-            self.emote_var.set(self.emotes[0])
-        
         ttk.Button(emote_frame, text="Perform", 
-                  command=lambda: self.test_api_call("gesture", {"gesture_name": self.emote_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("gesture", ("gesture_name", self.emote_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(emote_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("gesture", {"gesture_name": self.emote_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("gesture", ("gesture_name", self.emote_var))).pack(side=tk.LEFT)
         
         # Admin Commands Section
         admin_frame = ttk.Frame(player_frame)
         admin_frame.pack(fill="x", pady=(5, 0))
         
         # Noclip
-        noclip_frame = ttk.Frame(admin_frame)
-        noclip_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(noclip_frame, text="Noclip ON", 
-                  command=lambda: self.test_api_call("noclip_toggle", {"enable": True})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(noclip_frame, text="Noclip OFF", 
-                  command=lambda: self.test_api_call("noclip_toggle", {"enable": False})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(noclip_frame, text="Copy ON PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("noclip_toggle", {"enable": True})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(noclip_frame, text="Copy OFF PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("noclip_toggle", {"enable": False})).pack(side=tk.LEFT)
+        self.noclip_var = self._make_toggle_row(admin_frame, "Noclip", "noclip_toggle")
         
         # God Mode
-        god_frame = ttk.Frame(admin_frame)
-        god_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(god_frame, text="God Mode ON", 
-                  command=lambda: self.test_api_call("god_mode_toggle", {"enable": True})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(god_frame, text="God Mode OFF", 
-                  command=lambda: self.test_api_call("god_mode_toggle", {"enable": False})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(god_frame, text="Copy ON PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("god_mode_toggle", {"enable": True})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(god_frame, text="Copy OFF PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("god_mode_toggle", {"enable": False})).pack(side=tk.LEFT)
+        self.god_mode_var = self._make_toggle_row(admin_frame, "God Mode", "god_mode_toggle")
         
         # Time Control
         time_frame = ttk.Frame(admin_frame)
@@ -1613,52 +1731,18 @@ class RustControllerGUI:
         
         self.time_var = tk.StringVar(value="12")
         time_combo = ttk.Combobox(time_frame, textvariable=self.time_var, 
-                                 values=["0", "4", "8", "12", "16", "20", "24"], width=5, state="readonly")
+                                 values=self.TIME_VALUES, width=5, state="readonly")
         time_combo.pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(time_frame, text="Set Time", 
-                  command=lambda: self.test_api_call("set_time", {"time_hour": int(self.time_var.get())})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("set_time", ("time_hour", self.time_var, int))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(time_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("set_time", {"time_hour": int(self.time_var.get())})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("set_time", ("time_hour", self.time_var, int))).pack(side=tk.LEFT)
         
         # Teleport and Console
-        teleport_console_frame = ttk.Frame(admin_frame)
-        teleport_console_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(teleport_console_frame, text="Teleport to Marker", 
-                  command=lambda: self.test_api_call("teleport_to_marker", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(teleport_console_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("teleport_to_marker", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(teleport_console_frame, text="Toggle Combat Log", 
-                  command=lambda: self.test_api_call("toggle_combat_log", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(teleport_console_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("toggle_combat_log", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(teleport_console_frame, text="Ent Kill", 
-                  command=lambda: self.test_api_call("ent_kill", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(teleport_console_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("ent_kill", {})).pack(side=tk.LEFT)
-        
-        # Console Controls
-        console_frame = ttk.Frame(admin_frame)
-        console_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(console_frame, text="Clear Console", 
-                  command=lambda: self.test_api_call("clear_console", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(console_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("clear_console", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(console_frame, text="Toggle Console", 
-                  command=lambda: self.test_api_call("toggle_console", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(console_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("toggle_console", {})).pack(side=tk.LEFT)
+        for actions in self.ADMIN_ACTION_ROWS:
+            self._build_action_row(admin_frame, actions)
         
         # Chat Section
         chat_frame = ttk.LabelFrame(scrollable_frame, text="Chat", padding="5")
@@ -1673,10 +1757,10 @@ class RustControllerGUI:
         ttk.Entry(global_chat_frame, textvariable=self.global_chat_var, width=25).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(global_chat_frame, text="Send", 
-                  command=lambda: self.test_api_call("global_chat", {"message": self.global_chat_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("global_chat", ("message", self.global_chat_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(global_chat_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("global_chat", {"message": self.global_chat_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("global_chat", ("message", self.global_chat_var))).pack(side=tk.LEFT)
         
         # Team Chat
         ttk.Label(chat_frame, text="Team Chat:").pack(anchor=tk.W, pady=(10, 0))
@@ -1687,30 +1771,17 @@ class RustControllerGUI:
         ttk.Entry(team_chat_frame, textvariable=self.team_chat_var, width=25).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(team_chat_frame, text="Send", 
-                  command=lambda: self.test_api_call("team_chat", {"message": self.team_chat_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("team_chat", ("message", self.team_chat_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(team_chat_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("team_chat", {"message": self.team_chat_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("team_chat", ("message", self.team_chat_var))).pack(side=tk.LEFT)
         
         # Game Management Section
         game_frame = ttk.LabelFrame(scrollable_frame, text="Game Management", padding="5")
         game_frame.pack(fill="x", pady=(0, 10))
         
         # Quit and Disconnect
-        quit_disconnect_frame = ttk.Frame(game_frame)
-        quit_disconnect_frame.pack(fill="x", pady=(0, 5))
-        
-        ttk.Button(quit_disconnect_frame, text="Quit Game", 
-                  command=lambda: self.test_api_call("quit_game", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(quit_disconnect_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("quit_game", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(quit_disconnect_frame, text="Disconnect", 
-                  command=lambda: self.test_api_call("disconnect", {})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(quit_disconnect_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("disconnect", {})).pack(side=tk.LEFT)
+        self._build_action_row(game_frame, self.GAME_ACTIONS)
         
         # Connect to Server
         ttk.Label(game_frame, text="Connect to Server:").pack(anchor=tk.W, pady=(10, 0))
@@ -1721,81 +1792,26 @@ class RustControllerGUI:
         ttk.Entry(connect_frame, textvariable=self.server_ip_var, width=20).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(connect_frame, text="Connect", 
-                  command=lambda: self.test_api_call("connect", {"server_ip": self.server_ip_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("connect", ("server_ip", self.server_ip_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(connect_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("connect", {"server_ip": self.server_ip_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("connect", ("server_ip", self.server_ip_var))).pack(side=tk.LEFT)
         
         # Settings Section
         settings_frame = ttk.LabelFrame(scrollable_frame, text="Settings", padding="5")
         settings_frame.pack(fill="x", pady=(0, 10))
         
-        # Look at radius
-        ttk.Label(settings_frame, text="Look at Radius:").pack(anchor=tk.W)
-        radius_frame = ttk.Frame(settings_frame)
-        radius_frame.pack(fill="x", pady=(0, 5))
-        
-        self.radius_var = tk.StringVar(value="20")
-        radius_combo = ttk.Combobox(radius_frame, textvariable=self.radius_var, 
-                                   values=["20", "0.0002"], width=10, state="readonly")
-        radius_combo.pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(radius_frame, text="Set", 
-                  command=lambda: self.test_api_call("set_look_radius", {"radius": float(self.radius_var.get())})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(radius_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("set_look_radius", {"radius": float(self.radius_var.get())})).pack(side=tk.LEFT)
-        
-        # Volume controls
-        volume_frame = ttk.Frame(settings_frame)
-        volume_frame.pack(fill="x", pady=(10, 0))
-        
-        # Voice Volume
-        ttk.Label(volume_frame, text="Voice Volume:").pack(anchor=tk.W)
-        voice_volume_frame = ttk.Frame(volume_frame)
-        voice_volume_frame.pack(fill="x", pady=(0, 5))
-        
-        self.voice_volume_var = tk.StringVar(value="0.5")
-        voice_volume_combo = ttk.Combobox(voice_volume_frame, textvariable=self.voice_volume_var, 
-                                         values=["0", "0.25", "0.5", "0.75", "1"], width=10, state="readonly")
-        voice_volume_combo.pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(voice_volume_frame, text="Set", 
-                  command=lambda: self.test_api_call("set_voice_volume", {"volume": float(self.voice_volume_var.get())})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(voice_volume_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("set_voice_volume", {"volume": float(self.voice_volume_var.get())})).pack(side=tk.LEFT, padx=(0, 10))
-        
-        # Master Volume
-        ttk.Label(volume_frame, text="Master Volume:").pack(anchor=tk.W, pady=(10, 0))
-        master_volume_frame = ttk.Frame(volume_frame)
-        master_volume_frame.pack(fill="x", pady=(0, 5))
-        
-        self.master_volume_var = tk.StringVar(value="0.5")
-        master_volume_combo = ttk.Combobox(master_volume_frame, textvariable=self.master_volume_var, 
-                                          values=["0", "0.25", "0.5", "0.75", "1"], width=10, state="readonly")
-        master_volume_combo.pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(master_volume_frame, text="Set", 
-                  command=lambda: self.test_api_call("set_master_volume", {"volume": float(self.master_volume_var.get())})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(master_volume_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("set_master_volume", {"volume": float(self.master_volume_var.get())})).pack(side=tk.LEFT)
-        
-        # HUD State
-        hud_frame = ttk.Frame(settings_frame)
-        hud_frame.pack(fill="x", pady=(10, 0))
-        
-        ttk.Label(hud_frame, text="HUD State:").pack(anchor=tk.W)
-        self.hud_state_var = tk.StringVar(value="enabled")
-        hud_combo = ttk.Combobox(hud_frame, textvariable=self.hud_state_var, values=["enabled", "disabled"], width=10, state="readonly")
-        hud_combo.pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(hud_frame, text="Set", 
-                  command=lambda: self.test_api_call("set_hud_state", {"enabled": self.hud_state_var.get() == "enabled"})).pack(side=tk.LEFT, padx=(0, 5))
-        
-        ttk.Button(hud_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("set_hud_state", {"enabled": self.hud_state_var.get() == "enabled"})).pack(side=tk.LEFT)
+        # Settings rows share the same Label + Combobox + Set + Copy PowerShell layout
+        for index, (label, var_name, default, values, action, key, cast) in enumerate(self.SETTINGS_ROWS):
+            ttk.Label(settings_frame, text=label).pack(anchor=tk.W, pady=(10, 0) if index else 0)
+            row_frame = ttk.Frame(settings_frame)
+            row_frame.pack(fill="x", pady=(0, 5))
+            
+            var = tk.StringVar(value=default)
+            setattr(self, var_name, var)
+            ttk.Combobox(row_frame, textvariable=var, values=values, width=10, state="readonly").pack(side=tk.LEFT, padx=(0, 5))
+            
+            self._make_action_buttons(row_frame, action, (key, var, cast))
         
         # Anti-AFK Section
         anti_afk_frame = ttk.Frame(settings_frame)
@@ -1804,7 +1820,8 @@ class RustControllerGUI:
         ttk.Label(anti_afk_frame, text="Anti-AFK:").pack(anchor=tk.W)
         
         # Anti-AFK status label
-        self.anti_afk_status_var = tk.StringVar(value="Status: Unknown")
+        self._anti_afk_status = "Status: Unknown"
+        self.anti_afk_status_var = tk.StringVar(value=self._anti_afk_status)
         anti_afk_status_label = ttk.Label(anti_afk_frame, textvariable=self.anti_afk_status_var)
         anti_afk_status_label.pack(anchor=tk.W, pady=(0, 5))
         
@@ -1822,10 +1839,10 @@ class RustControllerGUI:
                   command=self.check_anti_afk_status).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(anti_afk_buttons_frame, text="Copy PowerShell (Start)", 
-                  command=lambda: self.copy_curl_to_clipboard("start_anti_afk", {})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._copy_cmd("start_anti_afk", {})).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(anti_afk_buttons_frame, text="Copy PowerShell (Stop)", 
-                  command=lambda: self.copy_curl_to_clipboard("stop_anti_afk", {})).pack(side=tk.LEFT)
+                  command=self._copy_cmd("stop_anti_afk", {})).pack(side=tk.LEFT)
         
         # Input/Clipboard Section
         input_frame = ttk.LabelFrame(scrollable_frame, text="Input & Clipboard", padding="5")
@@ -1840,10 +1857,10 @@ class RustControllerGUI:
         ttk.Entry(json_frame, textvariable=self.json_var, width=25).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(json_frame, text="Copy", 
-                  command=lambda: self.test_api_call("copy_json", {"json_data": self.json_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("copy_json", ("json_data", self.json_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(json_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("copy_json", {"json_data": self.json_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("copy_json", ("json_data", self.json_var))).pack(side=tk.LEFT)
         
         # Type string and enter
         ttk.Label(input_frame, text="Type String & Enter:").pack(anchor=tk.W, pady=(10, 0))
@@ -1854,29 +1871,26 @@ class RustControllerGUI:
         ttk.Entry(type_frame, textvariable=self.type_string_var, width=25).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(type_frame, text="Type", 
-                  command=lambda: self.test_api_call("type_string", {"text": self.type_string_var.get()})).pack(side=tk.LEFT, padx=(0, 5))
+                  command=self._api_var_cmd("type_string", ("text", self.type_string_var))).pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(type_frame, text="Copy PowerShell", 
-                  command=lambda: self.copy_curl_to_clipboard("type_string", {"text": self.type_string_var.get()})).pack(side=tk.LEFT)
+                  command=self._copy_var_cmd("type_string", ("text", self.type_string_var))).pack(side=tk.LEFT)
     
     def on_minimize(self, event=None):
         """Handle minimize button click"""
-        # Check if the window is being minimized (not just moved or resized)
+        # The root binding also sees child widgets being unmapped; only the window itself matters
+        if event is not None and event.widget is not self.root:
+            return
+        # Check if the window is being minimized (not just withdrawn to the tray)
         if self.root.state() == 'iconic':
             self.minimize_to_tray()
     
-    def on_configure(self, event=None):
-        """Handle window configuration changes"""
-        # Check if window is being minimized
-        if hasattr(self, 'root') and self.root:
-            if self.root.state() == 'iconic':
-                # Small delay to ensure the minimize action is complete
-                self.root.after(100, self.minimize_to_tray)
-    
     def minimize_to_tray(self):
         """Minimize window to system tray"""
         self.root.withdraw()
-        self.tray_icon.visible = True
+        # If the tray is still being built it becomes visible as soon as it runs
+        if self.tray_icon:
+            self.tray_icon.visible = True
     
     def show_window(self, icon=None, item=None):
         """Show the main window"""
@@ -1908,9 +1922,30 @@ class RustControllerGUI:
                            "• Ctrl+Q: Exit application\n"
                            "• Alt+M: Minimize to tray")
     
+    def _handle_signal(self, signum, frame):
+        """Handle SIGINT/SIGTERM by quitting from the Tk thread"""
+        if self.root is not None:
+            # quit_app sets shutdown_event itself; setting it here would make it return early
+            self.root.after(0, self.quit_app)
+        else:
+            # GUI not up yet - behave like a plain Ctrl+C
+            self.shutdown_event.set()
+            raise KeyboardInterrupt
+    
+    def _flush_for_exit(self):
+        """Flush logging and close the HTTP session; os._exit skips atexit and logging.shutdown"""
+        # The listener thread never calls into Tk, so joining it here can't deadlock
+        self.log_listener.stop()
+        logging.shutdown()
+        self.http.close()
+    
     def quit_app(self, icon=None, item=None):
         """Quit the application"""
+        # Tray, Ctrl+Q and signals can all request a quit; only the first one tears down
+        if self.shutdown_event.is_set():
+            return
         self.shutdown_event.set()
+        self._flush_for_exit()
         self.stop_server()
         if self.tray_icon:
             self.tray_icon.visible = False
@@ -1919,25 +1954,6 @@ class RustControllerGUI:
         # Force exit the process
         os._exit(0)
     
-    def check_api_connection_status(self):
-        """Check API connection status and automatically check for updates"""
-        try:
-            # Test API connection
-            response = requests.get("http://localhost:5000/steam/test-installation", timeout=5)
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('success'):
-                    self.database_status_var.set("API: Connected to Rust API - Checking for updates...")
-                    # Automatically check for database updates on startup
-                    self.check_database_updates_on_startup()
-                else:
-                    self.database_status_var.set("API: Connection failed")
-            else:
-                self.database_status_var.set("API: Connection error")
-                
-        except Exception as e:
-            self.database_status_var.set(f"API: Error checking connection - {str(e)}")
-    
     def check_database_updates_on_startup(self):
         """Check if database needs updating on startup"""
         try:
@@ -1952,13 +1968,13 @@ class RustControllerGUI:
                 if file_age_hours > 24:
                     self.database_status_var.set("API: Connected - Database may be outdated (>24h old)")
                     # Show a non-blocking message about potential updates
-                    self.root.after(3000, lambda: self.show_startup_update_suggestion())
+                    self.root.after(3000, self.show_startup_update_suggestion)
                 else:
                     self.database_status_var.set("API: Connected to Rust API - Database up to date")
             else:
                 # No database exists, suggest initial download
                 self.database_status_var.set("API: Connected - No database found, click 'Update Item Database'")
-                self.root.after(2000, lambda: self.show_startup_update_suggestion())
+                self.root.after(2000, self.show_startup_update_suggestion)
                 
         except Exception as e:
             self.database_status_var.set(f"API: Connected - Error checking database: {str(e)}")
@@ -1982,7 +1998,7 @@ class RustControllerGUI:
     def test_api_connection(self):
         """Test API connection"""
         try:
-            response = requests.get("http://localhost:5000/steam/test-installation", timeout=10)
+            response = self.http.get(TEST_INSTALLATION_URL, timeout=(CONNECT_TIMEOUT, 10))
             if response.status_code == 200:
                 result = response.json()
                 if result.get('success'):
@@ -2001,49 +2017,98 @@ class RustControllerGUI:
     
 
     
+    def _set_widget_state(self, widget, state):
+        """Configure a widget's state only when it actually changes"""
+        if str(widget.cget("state")) != state:
+            widget.config(state=state)
+    
     def update_item_database(self):
         """Update the item database using API"""
         # Disable update button during update
-        self.update_database_button.config(state="disabled")
+        self._set_widget_state(self.update_database_button, "disabled")
         self.progress_var.set(0)
         self.progress_label_var.set("Starting database update from API...")
+        self._last_progress_int = 0
+        self._last_progress_msg = None
         
-        def progress_callback(progress, message):
-            """Callback for progress updates"""
-            self.root.after(0, lambda: self.update_progress(progress, message))
-        
-        def update_thread():
+        self._update_future = self._executor.submit(self._update_worker)
+        self.root.after(33, self._poll_progress)
+    
+    def _update_worker(self):
+        """Run the database update and post the result to the main thread"""
+        try:
+            result = api_data_manager.update_item_database(progress_callback=self._queue_progress)
+            
+            # The window is being torn down; there is nothing left to report to
+            if self.shutdown_event.is_set():
+                return
+            
+            # Update UI in main thread
+            self.root.after(0, self.handle_update_result, result)
+            
+        except UpdateCancelled:
+            return
+        except Exception as e:
+            self.root.after(0, self.handle_update_result, {
+                "success": False,
+                "message": f"Update error: {str(e)}"
+            })
+    
+    def _queue_progress(self, progress, message):
+        """Callback for progress updates (called from the worker thread)"""
+        # Each progress step doubles as a cancellation point so exit doesn't wait on the update
+        if self.shutdown_event.is_set():
+            raise UpdateCancelled()
+        self._progress_queue.put_nowait((progress, message))
+    
+    def _flush_progress(self):
+        """Apply only the latest queued progress update (called from main thread)"""
+        get_nowait = self._progress_queue.get_nowait
+        latest = None
+        while True:
             try:
-                result = api_data_manager.update_item_database(progress_callback=progress_callback)
-                
-                # Update UI in main thread
-                self.root.after(0, lambda: self.handle_update_result(result))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.handle_update_result({
-                    "success": False,
-                    "message": f"Update error: {str(e)}"
-                }))
+                latest = get_nowait()
+            except queue.Empty:
+                break
         
-        threading.Thread(target=update_thread, daemon=True).start()
+        if latest:
+            self.update_progress(*latest)
+    
+    def _poll_progress(self):
+        """Drain progress updates until the database update finishes"""
+        self._flush_progress()
+        if self._update_future and not self._update_future.done():
+            self.root.after(33, self._poll_progress)
     
     def update_progress(self, progress, message):
-        """Update progress bar and label"""
-        self.progress_var.set(progress)
-        self.progress_label_var.set(message)
+        """Update progress bar and label, skipping values that haven't changed"""
+        progress_int = int(progress)
+        if progress_int != self._last_progress_int:
+            self._last_progress_int = progress_int
+            self.progress_var.set(progress)
+        
+        if message != self._last_progress_msg:
+            self._last_progress_msg = message
+            self.progress_label_var.set(message)
     
     def handle_update_result(self, result):
         """Handle database update result"""
-        self.update_database_button.config(state="normal")
+        # Apply any progress still pending so it can't overwrite the result below
+        self._flush_progress()
+        self._set_widget_state(self.update_database_button, "normal")
         
         if result["success"]:
             self.progress_label_var.set(f"Update complete: {result['message']}")
-            messagebox.showinfo("Success", f"Database updated successfully!\n{result['message']}")
-            # Refresh database stats
-            stats_data = self._fetch_database_stats()
-            self._update_db_stats_display(stats_data)
+            # Refresh database stats, preferring the counts the update already returned
+            if result.get("stats"):
+                self._update_db_stats_display(self._format_database_stats(result["stats"]))
+            else:
+                future = self._executor.submit(self._fetch_database_stats)
+                future.add_done_callback(self._on_stats_fetched)
             # Automatically refresh the crafting dropdowns with new data
             self.refresh_item_dropdowns()
+            # Modal, so it comes last: the refreshes above are already under way while it's open
+            messagebox.showinfo("Success", f"Database updated successfully!\n{result['message']}")
         else:
             self.progress_label_var.set(f"Update failed: {result['message']}")
             messagebox.showerror("Update Failed", result["message"])
@@ -2051,55 +2116,59 @@ class RustControllerGUI:
     def regenerate_rust_actions_binds(self):
         """Regenerate all rust-actions binds in keys.cfg"""
         # Disable regenerate button during operation
-        self.regenerate_binds_button.config(state="disabled")
+        self._set_widget_state(self.regenerate_binds_button, "disabled")
         self.progress_label_var.set("Regenerating rust-actions binds...")
         
-        def regenerate_thread():
+        self._executor.submit(self._regenerate_worker)
+    
+    def _regenerate_worker(self):
+        """Regenerate binds through the Flask server and post the result to the main thread"""
+        try:
+            # Call the Flask server to regenerate binds with cleared dynamic binds
             try:
-                # Call the Flask server to regenerate binds with cleared dynamic binds
+                response = self.http.post(REGENERATE_BINDS_URL, timeout=(CONNECT_TIMEOUT, 30))
+                if response.status_code == 200:
+                    result = orjson.loads(response.content)
+                    success = result.get('success', False)
+                    if not success:
+                        self.log_message(f"⚠️ Regenerate warning: {result.get('message', 'Unknown error')}")
+                else:
+                    success = False
+                    self.log_message(f"⚠️ Could not regenerate binds: HTTP {response.status_code}")
+            except Exception as e:
+                success = False
+                self.log_message(f"⚠️ Error calling regenerate endpoint: {str(e)}")
+            
+            if success:
+                # Clear keyboard manager cache and refresh it
                 try:
-                    response = requests.post("http://localhost:5000/binds-manager/regenerate-cleared", timeout=30)
+                    # Get the keyboard manager instance from the Flask app
+                    response = self.http.get(CLEAR_KEYBOARD_CACHE_URL, timeout=(CONNECT_TIMEOUT, 5))
                     if response.status_code == 200:
-                        result = response.json()
-                        success = result.get('success', False)
-                        if not success:
-                            self.log_message(f"⚠️ Regenerate warning: {result.get('message', 'Unknown error')}")
+                        result = orjson.loads(response.content)
+                        if result.get('success'):
+                            self.log_message("✅ Keyboard manager cache cleared successfully")
+                        else:
+                            self.log_message(f"⚠️ Keyboard manager cache clear warning: {result.get('message', 'Unknown')}")
                     else:
-                        success = False
-                        self.log_message(f"⚠️ Could not regenerate binds: HTTP {response.status_code}")
+                        self.log_message(f"⚠️ Could not clear keyboard manager cache: HTTP {response.status_code}")
                 except Exception as e:
-                    success = False
-                    self.log_message(f"⚠️ Error calling regenerate endpoint: {str(e)}")
-                
-                if success:
-                    # Clear keyboard manager cache and refresh it
-                    try:
-                        # Get the keyboard manager instance from the Flask app
-                        response = requests.get("http://localhost:5000/keyboard-manager/clear-cache", timeout=5)
-                        if response.status_code == 200:
-                            result = response.json()
-                            if result.get('success'):
-                                self.log_message("✅ Keyboard manager cache cleared successfully")
-                            else:
-                                self.log_message(f"⚠️ Keyboard manager cache clear warning: {result.get('message', 'Unknown')}")
-                        else:
-                            self.log_message(f"⚠️ Could not clear keyboard manager cache: HTTP {response.status_code}")
-                    except Exception as e:
-                        self.log_message(f"⚠️ Error clearing keyboard manager cache: {str(e)}")
-                    
-                    self.log_message("✅ Dynamic binds have been RESET and cleared")
-                
-                # Update UI in main thread
-                self.root.after(0, lambda: self.handle_regenerate_result(success))
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.handle_regenerate_result(False, str(e)))
-        
-        threading.Thread(target=regenerate_thread, daemon=True).start()
+                    self.log_message(f"⚠️ Error clearing keyboard manager cache: {str(e)}")
+            
+                self.log_message("✅ Dynamic binds have been RESET and cleared")
+            
+            if self.shutdown_event.is_set():
+                return
+            
+            # Update UI in main thread
+            self.root.after(0, self.handle_regenerate_result, success)
+            
+        except Exception as e:
+            self.root.after(0, self.handle_regenerate_result, False, str(e))
     
     def handle_regenerate_result(self, success, error_message=None):
         """Handle regenerate binds result"""
-        self.regenerate_binds_button.config(state="normal")
+        self._set_widget_state(self.regenerate_binds_button, "normal")
         
         if success:
             self.progress_label_var.set("Rust-actions binds regenerated and RESET successfully!")
@@ -2111,43 +2180,49 @@ class RustControllerGUI:
     
     def run(self):
         """Start the GUI application"""
-        # Check API connection status on startup
+        # Check API connection status on startup; runs alongside the dropdown fetch
+        # started by _build_gui, and both report back once the main loop is up
         self.check_api_connection_status()
         self.root.mainloop()
 
     def toggle_api_panel(self):
         """Toggle the API testing panel visibility"""
-        if hasattr(self, 'api_frame'):
-            if self.api_panel_visible:
-                # Currently visible, so hide it
-                self.api_frame.grid_remove()
-                self.api_menu.entryconfig(0, label="Show API Testing Panel")
-                self.api_panel_visible = False
-            else:
-                # Currently hidden, so show it
-                self.api_frame.grid(row=1, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
-                self.api_menu.entryconfig(0, label="Hide API Testing Panel")
-                self.api_panel_visible = True
+        if self.api_frame is None:
+            # First show: build the panel and load the items fetched so far
+            self.create_api_testing_panel(self._api_panel_parent)
+            self._fill_item_dropdowns()
+        
+        if self.api_panel_visible:
+            # Currently visible, so hide it
+            self.api_frame.grid_remove()
+            self.api_menu.entryconfig(0, label="Show API Testing Panel")
+            self.api_panel_visible = False
+        else:
+            # Currently hidden, so show it
+            self.api_frame.grid(row=1, column=1, rowspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
+            self.api_menu.entryconfig(0, label="Hide API Testing Panel")
+            self.api_panel_visible = True
 
     def toggle_startup(self):
         """Toggle startup with Windows option"""
         try:
-            current_state = self.check_startup_enabled()
+            current_state = self.startup_enabled
             if current_state:
                 # Disable startup
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                   r"Software\Microsoft\Windows\CurrentVersion\Run", 
-                                   0, winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE)
-                try:
-                    winreg.DeleteValue(key, "RustGameController")
-                except:
-                    pass
-                winreg.CloseKey(key)
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
+                                    r"Software\Microsoft\Windows\CurrentVersion\Run", 
+                                    0, winreg.KEY_SET_VALUE) as key:
+                    try:
+                        winreg.DeleteValue(key, "RustGameController")
+                    except:
+                        pass
+                self._last_startup_cmd = None
                 self.log_message("Startup disabled")
             else:
                 # Enable startup
                 self.update_startup_command()
                 self.log_message("Startup enabled")
+            self.startup_enabled = not current_state
             
             # Update menu label
             self.update_menu_labels()
@@ -2158,31 +2233,20 @@ class RustControllerGUI:
     def toggle_start_minimized(self):
         """Toggle start minimized option"""
         try:
-            current_state = self.check_start_minimized_enabled()
+            current_state = self.start_minimized_enabled
             
-            # Create the key if it doesn't exist
-            try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                   r"Software\RustGameController", 
-                                   0, winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE)
-            except FileNotFoundError:
-                # Create the key
-                key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, 
-                                     r"Software\RustGameController")
+            # CreateKey opens the key when it already exists, so one call covers both cases
+            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Software\RustGameController") as key:
+                winreg.SetValueEx(key, "StartMinimized", 0, winreg.REG_DWORD, 0 if current_state else 1)
             
             if current_state:
-                # Disable start minimized
-                winreg.SetValueEx(key, "StartMinimized", 0, winreg.REG_DWORD, 0)
                 self.log_message("Start minimized disabled")
             else:
-                # Enable start minimized
-                winreg.SetValueEx(key, "StartMinimized", 0, winreg.REG_DWORD, 1)
                 self.log_message("Start minimized enabled")
-            
-            winreg.CloseKey(key)
+            self.start_minimized_enabled = not current_state
             
             # Update startup command if startup is enabled
-            if self.check_startup_enabled():
+            if self.startup_enabled:
                 self.update_startup_command()
             
             # Update menu label
@@ -2193,47 +2257,47 @@ class RustControllerGUI:
 
     def update_menu_labels(self):
         """Update menu labels to reflect current state"""
-        if hasattr(self, 'launch_menu'):
+        if self.launch_menu is not None:
             # Update startup label
-            startup_enabled = self.check_startup_enabled()
-            startup_label = "Start on Boot: Enabled" if startup_enabled else "Start on Boot: Disabled"
+            startup_label = "Start on Boot: Enabled" if self.startup_enabled else "Start on Boot: Disabled"
             self.launch_menu.entryconfig(0, label=startup_label)
             
             # Update start minimized label
-            start_minimized_enabled = self.check_start_minimized_enabled()
-            start_minimized_label = "Start Minimized: Enabled" if start_minimized_enabled else "Start Minimized: Disabled"
+            start_minimized_label = "Start Minimized: Enabled" if self.start_minimized_enabled else "Start Minimized: Disabled"
             self.launch_menu.entryconfig(1, label=start_minimized_label)
 
     def update_startup_command(self):
         """Update the startup command in registry"""
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                               r"Software\Microsoft\Windows\CurrentVersion\Run", 
-                               0, winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE)
-            
-            app_path = sys.argv[0]
-            if app_path.endswith('.py'):
-                # If running as script, use python executable
-                app_path = f'"{sys.executable}" "{app_path}"'
+            # Add start minimized parameter if enabled
+            if self.start_minimized_enabled:
+                app_path = self._startup_cmd + ' --minimized'
             else:
-                # If running as exe
-                app_path = f'"{app_path}"'
+                app_path = self._startup_cmd
             
-            # Add start minimized parameter if enabled
-            if self.check_start_minimized_enabled():
-                app_path += ' --minimized'
+            # Skip the registry write when this session already stored the same command
+            if app_path == self._last_startup_cmd:
+                return
             
-            winreg.SetValueEx(key, "RustGameController", 0, winreg.REG_SZ, app_path)
-            winreg.CloseKey(key)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
+                                r"Software\Microsoft\Windows\CurrentVersion\Run", 
+                                0, winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, "RustGameController", 0, winreg.REG_SZ, app_path)
+            self._last_startup_cmd = app_path
             
         except Exception as e:
             self.log_message(f"Failed to update startup command: {e}")
 
     def check_api_connection_status(self):
         """Check API connection status"""
+        # Test API connection instead of Steam login, off the Tk thread
+        future = self._api_executor.submit(self.http.get, TEST_INSTALLATION_URL, timeout=(CONNECT_TIMEOUT, 5))
+        future.add_done_callback(functools.partial(self._deliver_future, self._apply_api_connection_status))
+    
+    def _apply_api_connection_status(self, future):
+        """Show the result of an API connection test (called from main thread)"""
         try:
-            # Test API connection instead of Steam login
-            response = requests.get("http://localhost:5000/steam/test-installation", timeout=5)
+            response = future.result()
             if response.status_code == 200:
                 result = response.json()
                 if result.get('success'):
@@ -2248,21 +2312,33 @@ class RustControllerGUI:
 
 def main():
     """Main entry point"""
-    app = RustControllerGUI()
-    
-    # Register cleanup function
-    def cleanup():
-        app.shutdown_event.set()
-    
-    atexit.register(cleanup)
-    
+    app = None
+    exit_code = 0
     try:
+        # Constructed inside the try so a Ctrl+C during startup takes the same exit path
+        app = RustControllerGUI()
+        
         # Start the GUI application
         app.run()
     except KeyboardInterrupt:
         print("Shutting down...")
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
     finally:
-        cleanup()
+        if app is not None:
+            app.shutdown_event.set()
+            app._executor.shutdown(wait=False, cancel_futures=True)
+            app._api_executor.shutdown(wait=False, cancel_futures=True)
+            app._flush_for_exit()
+        else:
+            logging.shutdown()
+        # Pool workers are non-daemon threads, and a normal interpreter exit would join
+        # whichever request is still running (up to 2 minutes for inventory actions).
+        # Leave the same way quit_app does instead, having flushed what atexit would have.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
 
 if __name__ == "__main__":
     main()
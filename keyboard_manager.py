@@ -20,105 +20,113 @@ except ImportError:
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Available keys mapping, built once at import and shared by every simulator
+AVAILABLE_KEYS = {
+    # Letters
+    'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd', 'e': 'e', 'f': 'f', 'g': 'g', 'h': 'h',
+    'i': 'i', 'j': 'j', 'k': 'k', 'l': 'l', 'm': 'm', 'n': 'n', 'o': 'o', 'p': 'p',
+    'q': 'q', 'r': 'r', 's': 's', 't': 't', 'u': 'u', 'v': 'v', 'w': 'w', 'x': 'x',
+    'y': 'y', 'z': 'z',
+    
+    # Numbers
+    '0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5', '6': '6', '7': '7',
+    '8': '8', '9': '9',
+    
+    # Function keys
+    'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4, 'f5': Key.f5, 'f6': Key.f6,
+    'f7': Key.f7, 'f8': Key.f8, 'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12,
+    'f13': Key.f13, 'f14': Key.f14, 'f15': Key.f15, 'f16': Key.f16,
+    'f17': Key.f17, 'f18': Key.f18, 'f19': Key.f19, 'f20': Key.f20,
+    'f21': Key.f21, 'f22': Key.f22, 'f23': Key.f23, 'f24': Key.f24,
+    
+    # Modifier keys
+    'ctrl': Key.ctrl, 'left_ctrl': Key.ctrl_l, 'right_ctrl': Key.ctrl_r,
+    'leftcontrol': Key.ctrl_l, 'rightcontrol': Key.ctrl_r,
+    'shift': Key.shift, 'left_shift': Key.shift_l, 'right_shift': Key.shift_r,
+    'leftshift': Key.shift_l, 'rightshift': Key.shift_r,
+    'alt': Key.alt, 'left_alt': Key.alt_l, 'right_alt': Key.alt_r,
+    'meta': Key.cmd, 'left_meta': Key.cmd_l, 'right_meta': Key.cmd_r,
+    'windows': Key.cmd, 'left_windows': Key.cmd_l, 'right_windows': Key.cmd_r,
+    'cmd': Key.cmd, 'left_cmd': Key.cmd_l, 'right_cmd': Key.cmd_r,
+    
+    # Special keys
+    'enter': Key.enter, 'return': Key.enter,
+    'space': Key.space,
+    'tab': Key.tab,
+    'escape': Key.esc, 'esc': Key.esc,
+    'backspace': Key.backspace,
+    'delete': Key.delete, 'del': Key.delete,
+    'insert': Key.insert, 'ins': Key.insert,
+    'home': Key.home,
+    'end': Key.end,
+    'pageup': Key.page_up, 'page_up': Key.page_up,
+    'pagedown': Key.page_down, 'page_down': Key.page_down,
+    'numlock': Key.num_lock, 'num_lock': Key.num_lock,
+    
+    # Arrow keys
+    'up': Key.up, 'up_arrow': Key.up, 'uparrow': Key.up,
+    'down': Key.down, 'down_arrow': Key.down, 'downarrow': Key.down,
+    'left': Key.left, 'left_arrow': Key.left, 'leftarrow': Key.left,
+    'right': Key.right, 'right_arrow': Key.right, 'rightarrow': Key.right,
+    
+    # Numpad keys (using virtual key codes)
+    'keypad0': KeyCode.from_vk(96), 'keypad1': KeyCode.from_vk(97), 'keypad2': KeyCode.from_vk(98),
+    'keypad3': KeyCode.from_vk(99), 'keypad4': KeyCode.from_vk(100), 'keypad5': KeyCode.from_vk(101),
+    'keypad6': KeyCode.from_vk(102), 'keypad7': KeyCode.from_vk(103), 'keypad8': KeyCode.from_vk(104),
+    'keypad9': KeyCode.from_vk(105), 'keypadperiod': KeyCode.from_vk(110), 'keypadenter': KeyCode.from_vk(108),
+    'keypadplus': KeyCode.from_vk(107), 'keypadminus': KeyCode.from_vk(109), 
+    'keypadmultiply': KeyCode.from_vk(106), 'keypaddivide': KeyCode.from_vk(111),
+    
+    # Punctuation and symbols
+    'comma': KeyCode.from_vk(188), ',': KeyCode.from_vk(188),
+    'period': KeyCode.from_vk(190), '.': KeyCode.from_vk(190),
+    'semicolon': KeyCode.from_vk(186), ';': KeyCode.from_vk(186),  # Use virtual key code for semicolon
+    'colon': ':', ':': ':',
+    'slash': KeyCode.from_vk(191), '/': KeyCode.from_vk(191),
+    'backslash': '\\', '\\': '\\',
+    'minus': '-', '-': '-',
+    'equals': '=', '=': '=',
+    'plus': '+', '+': '+',
+    'underscore': '_', '_': '_',
+    'bracket_left': KeyCode.from_vk(219), '[': KeyCode.from_vk(219), 'leftbracket': KeyCode.from_vk(219),
+    'bracket_right': KeyCode.from_vk(221), ']': KeyCode.from_vk(221), 'rightbracket': KeyCode.from_vk(221),
+    'brace_left': '{', '{': '{',
+    'brace_right': '}', '}': '}',
+    'pipe': '|', '|': '|',
+    'tilde': '~', '~': '~',
+    "backquote": "'", "'": "'",  # In Rust keys.cfg, 'backquote' means single quote/apostrophe
+    'backtick': '`', '`': '`',
+    'question': '?', '?': '?',
+    'exclamation': '!', '!': '!',
+    'at': '@', '@': '@',
+    'hash': '#', '#': '#',
+    'dollar': '$', '$': '$',
+    'percent': '%', '%': '%',
+    'caret': '^', '^': '^',
+    'ampersand': '&', '&': '&',
+    'asterisk': '*', '*': '*',
+    'parenthesis_left': '(', '(': '(',
+    'parenthesis_right': ')', ')': ')',
+}
+
 class KeyboardSimulator:
     def __init__(self):
         # Initialize the keyboard controller
         self.controller = keyboard.Controller()
         
         # Available keys mapping
-        self.available_keys = {
-            # Letters
-            'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd', 'e': 'e', 'f': 'f', 'g': 'g', 'h': 'h',
-            'i': 'i', 'j': 'j', 'k': 'k', 'l': 'l', 'm': 'm', 'n': 'n', 'o': 'o', 'p': 'p',
-            'q': 'q', 'r': 'r', 's': 's', 't': 't', 'u': 'u', 'v': 'v', 'w': 'w', 'x': 'x',
-            'y': 'y', 'z': 'z',
-            
-            # Numbers
-            '0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5', '6': '6', '7': '7',
-            '8': '8', '9': '9',
-            
-            # Function keys
-            'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4, 'f5': Key.f5, 'f6': Key.f6,
-            'f7': Key.f7, 'f8': Key.f8, 'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12,
-            'f13': Key.f13, 'f14': Key.f14, 'f15': Key.f15, 'f16': Key.f16,
-            'f17': Key.f17, 'f18': Key.f18, 'f19': Key.f19, 'f20': Key.f20,
-            'f21': Key.f21, 'f22': Key.f22, 'f23': Key.f23, 'f24': Key.f24,
-            
-            # Modifier keys
-            'ctrl': Key.ctrl, 'left_ctrl': Key.ctrl_l, 'right_ctrl': Key.ctrl_r,
-            'leftcontrol': Key.ctrl_l, 'rightcontrol': Key.ctrl_r,
-            'shift': Key.shift, 'left_shift': Key.shift_l, 'right_shift': Key.shift_r,
-            'leftshift': Key.shift_l, 'rightshift': Key.shift_r,
-            'alt': Key.alt, 'left_alt': Key.alt_l, 'right_alt': Key.alt_r,
-            'meta': Key.cmd, 'left_meta': Key.cmd_l, 'right_meta': Key.cmd_r,
-            'windows': Key.cmd, 'left_windows': Key.cmd_l, 'right_windows': Key.cmd_r,
-            'cmd': Key.cmd, 'left_cmd': Key.cmd_l, 'right_cmd': Key.cmd_r,
-            
-            # Special keys
-            'enter': Key.enter, 'return': Key.enter,
-            'space': Key.space,
-            'tab': Key.tab,
-            'escape': Key.esc, 'esc': Key.esc,
-            'backspace': Key.backspace,
-            'delete': Key.delete, 'del': Key.delete,
-            'insert': Key.insert, 'ins': Key.insert,
-            'home': Key.home,
-            'end': Key.end,
-            'pageup': Key.page_up, 'page_up': Key.page_up,
-            'pagedown': Key.page_down, 'page_down': Key.page_down,
-            'numlock': Key.num_lock, 'num_lock': Key.num_lock,
-            
-            # Arrow keys
-            'up': Key.up, 'up_arrow': Key.up, 'uparrow': Key.up,
-            'down': Key.down, 'down_arrow': Key.down, 'downarrow': Key.down,
-            'left': Key.left, 'left_arrow': Key.left, 'leftarrow': Key.left,
-            'right': Key.right, 'right_arrow': Key.right, 'rightarrow': Key.right,
-            
-            # Numpad keys (using virtual key codes)
-            'keypad0': KeyCode.from_vk(96), 'keypad1': KeyCode.from_vk(97), 'keypad2': KeyCode.from_vk(98),
-            'keypad3': KeyCode.from_vk(99), 'keypad4': KeyCode.from_vk(100), 'keypad5': KeyCode.from_vk(101),
-            'keypad6': KeyCode.from_vk(102), 'keypad7': KeyCode.from_vk(103), 'keypad8': KeyCode.from_vk(104),
-            'keypad9': KeyCode.from_vk(105), 'keypadperiod': KeyCode.from_vk(110), 'keypadenter': KeyCode.from_vk(108),
-            'keypadplus': KeyCode.from_vk(107), 'keypadminus': KeyCode.from_vk(109), 
-            'keypadmultiply': KeyCode.from_vk(106), 'keypaddivide': KeyCode.from_vk(111),
-            
-            # Punctuation and symbols
-            'comma': KeyCode.from_vk(188), ',': KeyCode.from_vk(188),
-            'period': KeyCode.from_vk(190), '.': KeyCode.from_vk(190),
-            'semicolon': KeyCode.from_vk(186), ';': KeyCode.from_vk(186),  # Use virtual key code for semicolon
-            'colon': ':', ':': ':',
-            'slash': KeyCode.from_vk(191), '/': KeyCode.from_vk(191),
-            'backslash': '\\', '\\': '\\',
-            'minus': '-', '-': '-',
-            'equals': '=', '=': '=',
-            'plus': '+', '+': '+',
-            'underscore': '_', '_': '_',
-            'bracket_left': KeyCode.from_vk(219), '[': KeyCode.from_vk(219), 'leftbracket': KeyCode.from_vk(219),
-            'bracket_right': KeyCode.from_vk(221), ']': KeyCode.from_vk(221), 'rightbracket': KeyCode.from_vk(221),
-            'brace_left': '{', '{': '{',
-            'brace_right': '}', '}': '}',
-            'pipe': '|', '|': '|',
-            'tilde': '~', '~': '~',
-            "backquote": "'", "'": "'",  # In Rust keys.cfg, 'backquote' means single quote/apostrophe
-            'backtick': '`', '`': '`',
-            'question': '?', '?': '?',
-            'exclamation': '!', '!': '!',
-            'at': '@', '@': '@',
-            'hash': '#', '#': '#',
-            'dollar': '$', '$': '$',
-            'percent': '%', '%': '%',
-            'caret': '^', '^': '^',
-            'ampersand': '&', '&': '&',
-            'asterisk': '*', '*': '*',
-            'parenthesis_left': '(', '(': '(',
-            'parenthesis_right': ')', ')': ')',
-        }
+        self.available_keys = AVAILABLE_KEYS
     
     def normalize_key(self, key):
         """Convert key name to pynput Key or KeyCode"""
-        if key in self.available_keys:
-            return self.available_keys[key]
-        return None
+        return self.available_keys.get(key)
+    
+    def _normalize(self, key):
+        """Convert key name to pynput Key or KeyCode, raising ValueError for unknown names"""
+        normalized_key = self.available_keys.get(key)
+        if normalized_key is None:
+            raise ValueError(f"Invalid key: {key}")
+        return normalized_key
     
     def is_rust_focused(self):
         """Check if RustClient.exe is the currently focused window"""
@@ -170,9 +178,7 @@ class KeyboardSimulator:
             logger.warning(f"Skipping key press '{key}' - Rust is not focused")
             return
         
-        normalized_key = self.normalize_key(key)
-        if not normalized_key:
-            raise ValueError(f"Invalid key: {key}")
+        normalized_key = self._normalize(key)
         
         try:
             # For numpad keys, ensure NumLock is on
@@ -206,17 +212,20 @@ class KeyboardSimulator:
             logger.warning(f"Skipping key combination '{'+'.join(keys)}' - Rust is not focused")
             return
         
-        import time
-        combo_start = time.time()
+        self._send_combo([self._normalize(key) for key in keys], keys)
+    
+    def combo_normalized(self, normalized_keys, keys: List[str]):
+        """Simulate a multi-key combination from keys already passed through normalize_key"""
+        # Check if Rust is focused before executing
+        if not self.is_rust_focused():
+            logger.warning(f"Skipping key combination '{'+'.join(keys)}' - Rust is not focused")
+            return
         
-        normalized_keys = []
-        normalize_start = time.time()
-        for key in keys:
-            normalized_key = self.normalize_key(key)
-            if not normalized_key:
-                raise ValueError(f"Invalid key: {key}")
-            normalized_keys.append(normalized_key)
-        normalize_time = time.time() - normalize_start
+        self._send_combo(normalized_keys, keys)
+    
+    def _send_combo(self, normalized_keys, keys: List[str]):
+        """Press and release normalized keys as one combination; keys is used for messages"""
+        combo_start = time.time()
         
         try:
             # Press all keys down
@@ -240,7 +249,7 @@ class KeyboardSimulator:
             
             # Log timing details for debugging (only if significant)
             if total_time > 0.02:  # Only log if combo takes more than 20ms (reduced threshold)
-                print(f"Combo timing - Normalize: {normalize_time:.4f}s, Press: {press_time:.4f}s, Hold: {hold_time:.4f}s, Release: {release_time:.4f}s, Total: {total_time:.4f}s")
+                print(f"Combo timing - Press: {press_time:.4f}s, Hold: {hold_time:.4f}s, Release: {release_time:.4f}s, Total: {total_time:.4f}s")
             
         except Exception as e:
             total_time = time.time() - combo_start
@@ -254,9 +263,7 @@ class KeyboardSimulator:
             logger.warning(f"Skipping key down '{key}' - Rust is not focused")
             return
         
-        normalized_key = self.normalize_key(key)
-        if not normalized_key:
-            raise ValueError(f"Invalid key: {key}")
+        normalized_key = self._normalize(key)
         
         try:
             self.controller.press(normalized_key)
@@ -270,9 +277,7 @@ class KeyboardSimulator:
             logger.warning(f"Skipping key up '{key}' - Rust is not focused")
             return
         
-        normalized_key = self.normalize_key(key)
-        if not normalized_key:
-            raise ValueError(f"Invalid key: {key}")
+        normalized_key = self._normalize(key)
         
         try:
             self.controller.release(normalized_key)
@@ -310,6 +315,8 @@ class KeyboardManager:
         
         # Cache for key combinations
         self._key_combo_cache = {}
+        # Same combinations already converted to pynput keys, so triggering skips normalization
+        self._normalized_combo_cache = {}
         
         # Thread lock for thread-safe operations
         self._lock = threading.Lock()
@@ -335,17 +342,18 @@ class KeyboardManager:
         
         # Clear the cache first
         self._key_combo_cache.clear()
+        self._normalized_combo_cache.clear()
         
         # Populate cache from binds_manager's key_combinations for regular binds
         for i, combo in enumerate(self.binds_manager.key_combinations):
-            self._key_combo_cache[i] = combo.split('+')
+            self._cache_key_combo(i, combo)
         
         # Populate cache for existing dynamic binds using the correct key combinations
         for bind_key, bind_index in self.binds_manager.dynamic_binds.items():
             # Use the unique key combination for this bind index from the key_combinations list
             if bind_index < len(self.binds_manager.key_combinations):
                 key_combo = self.binds_manager.key_combinations[bind_index]
-                self._key_combo_cache[bind_index] = key_combo.split('+')
+                self._cache_key_combo(bind_index, key_combo)
                 logger.info(f"Cached dynamic bind {bind_index} ({bind_key}) with key combo: {key_combo}")
             else:
                 logger.warning(f"Bind index {bind_index} exceeds available key combinations")
@@ -355,7 +363,7 @@ class KeyboardManager:
             if bind_index not in self.binds_manager.dynamic_binds.values():
                 if bind_index < len(self.binds_manager.key_combinations):
                     key_combo = self.binds_manager.key_combinations[bind_index]
-                    self._key_combo_cache[bind_index] = key_combo.split('+')
+                    self._cache_key_combo(bind_index, key_combo)
         
         logger.info(f"Cached {len(self._key_combo_cache)} key combinations")
         
@@ -374,6 +382,17 @@ class KeyboardManager:
         logger.info("Regenerating keys.cfg with protected write...")
         self.binds_manager.write_keys_cfg_with_sections_protected()
     
+    def _cache_key_combo(self, bind_index: int, key_combo: str):
+        """Cache a bind's key names and, when every name is valid, its pynput keys"""
+        keys = key_combo.split('+')
+        self._key_combo_cache[bind_index] = keys
+        normalized_keys = tuple(self.keyboard_simulator.normalize_key(key) for key in keys)
+        if None in normalized_keys:
+            # Leave it to combo() to report the invalid key when the bind is triggered
+            self._normalized_combo_cache.pop(bind_index, None)
+        else:
+            self._normalized_combo_cache[bind_index] = normalized_keys
+    
     def _refresh_dynamic_bind_cache(self):
         """Refresh the cache for dynamic binds only"""
         logger.info("Refreshing dynamic bind cache...")
@@ -383,7 +402,7 @@ class KeyboardManager:
             # Use the unique key combination for this bind index from the key_combinations list
             if bind_index < len(self.binds_manager.key_combinations):
                 key_combo = self.binds_manager.key_combinations[bind_index]
-                self._key_combo_cache[bind_index] = key_combo.split('+')
+                self._cache_key_combo(bind_index, key_combo)
                 logger.info(f"Refreshed dynamic bind {bind_index} ({bind_key}) with key combo: {key_combo}")
             else:
                 logger.warning(f"Bind index {bind_index} exceeds available key combinations")
@@ -396,7 +415,6 @@ class KeyboardManager:
     
     def trigger_bind(self, bind_index: int) -> bool:
         """Trigger a bind by its index"""
-        import time
         with self._lock:
             try:
                 cache_start = time.time()
@@ -408,7 +426,11 @@ class KeyboardManager:
                     return False
                 
                 combo_start = time.time()
-                self.keyboard_simulator.combo(key_combo)
+                normalized_keys = self._normalized_combo_cache.get(bind_index)
+                if normalized_keys is not None:
+                    self.keyboard_simulator.combo_normalized(normalized_keys, key_combo)
+                else:
+                    self.keyboard_simulator.combo(key_combo)
                 combo_time = time.time() - combo_start
                 
                 # Log timing details for debugging
@@ -439,7 +461,6 @@ class KeyboardManager:
     
     def bulk_craft_item(self, item_id: int, quantity: int = 1) -> bool:
         """Craft an item multiple times rapidly, calculating operations based on amountToCreate"""
-        import time
         import math
         start_time = time.time()
         
@@ -519,7 +540,6 @@ class KeyboardManager:
     
     def bulk_cancel_craft_item(self, item_id: int, quantity: int = 1) -> bool:
         """Cancel crafting an item multiple times rapidly, calculating operations based on amountToCreate"""
-        import time
         import math
         start_time = time.time()
         